@@ -12,26 +12,38 @@ License: Unlicense (Public Domain)
 """
 
 import argparse
-import html
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import logging
+import mmap
 import os
+import re
+import selectors
+import shutil
 import sqlite3
+import stat
+import struct
 import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import unescape as _html_unescape
 from pathlib import Path
 from threading import Lock
-from typing import Optional, Tuple, Dict, List
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, List, Mapping
 
-try:
-    from osgeo import gdal, ogr
-    gdal.UseExceptions()
-except ImportError:
-    print("ERREUR: GDAL n'est pas installé. Installez-le avec: pip install gdal")
-    sys.exit(1)
+# GDAL et pyarrow sont importés au premier besoin (voir _ensure_gdal()) :
+# --help et les erreurs d'arguments n'en paient pas le coût de chargement
+gdal = None
+ogr = None
+pa = None
 
 try:
     from tqdm import tqdm
@@ -39,13 +51,237 @@ except ImportError:
     tqdm = None
     print("AVERTISSEMENT: tqdm n'est pas installé. Installez-le avec: pip install tqdm pour la barre de progression")
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+    print("AVERTISSEMENT: lxml n'est pas installé. Installez-le avec: pip install lxml pour accélérer le parsing des domaines")
+
+
+
+def _ensure_gdal():
+    """
+    Importe GDAL/OGR (et pyarrow, utilisé avec l'API Arrow de GDAL) une seule fois.
+    
+    Quitte le programme si GDAL n'est pas installé.
+    """
+    global gdal, ogr, pa
+    if gdal is not None:
+        return
+    
+    try:
+        from osgeo import gdal as gdal_module, ogr as ogr_module
+    except ImportError:
+        print("ERREUR: GDAL n'est pas installé. Installez-le avec: pip install gdal")
+        sys.exit(1)
+    gdal_module.UseExceptions()
+    
+    try:
+        import pyarrow as pyarrow_module
+    except ImportError:
+        pyarrow_module = None
+        print("AVERTISSEMENT: pyarrow n'est pas installé. Installez-le avec: pip install pyarrow pour accélérer la lecture des tables (API Arrow de GDAL)")
+    
+    gdal, ogr, pa = gdal_module, ogr_module, pyarrow_module
+
+
+# Bloc XML d'un domaine codé dans un fichier .gdbtable (avec/sans suffixe "2")
+_DOMAIN_BLOCK_RE = re.compile(
+    rb'<(GPCodedValueDomain2?)\b[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE
+)
+
+# Parsing de repli (sans lxml) d'un bloc de domaine décodé
+_DOMAIN_NAME_RE = re.compile(r'<DomainName\b[^>]*>([^<]+)</DomainName>', re.IGNORECASE)
+_CODED_VALUE_RE = re.compile(r'<CodedValue\b[^>]*>.*?</CodedValue>', re.DOTALL | re.IGNORECASE)
+# Code et Name d'un bloc CodedValue en une seule recherche (ESRI écrit Name
+# avant Code, l'ordre inverse est aussi accepté)
+_CODE_NAME_RE = re.compile(
+    r'<Name\b[^>]*>([^<]+)</Name>.*?<Code\b[^>]*>([^<]+)</Code>'
+    r'|<Code\b[^>]*>([^<]+)</Code>.*?<Name\b[^>]*>([^<]+)</Name>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Catégorie d'une clé de métadonnées pouvant décrire un domaine (clé en majuscules)
+_DOMAIN_METADATA_KEY_RE = re.compile(r'CODE|DOMAIN|VALUE')
+
+# Paires "code:description" / "code=description" d'une chaîne de domaine, séparées
+# par ';' (la description peut contenir des virgules) ou par ','
+_DOMAIN_PAIR_SEMICOLON_RE = re.compile(r'(?:^|;)\s*([+-]?\d+)\s*[:=]([^;]*)')
+_DOMAIN_PAIR_COMMA_RE = re.compile(r'(?:^|,)\s*([+-]?\d+)\s*[:=]([^,]*)')
+
+# Rôles d'une colonne de table de domaine selon les termes contenus dans son nom
+# (nom du domaine, code, description)
+_DOMAIN_COLUMN_ROLES = {
+    'domain': ('domain',),
+    'name': ('domain', 'desc'),
+    'code': ('code',),
+    'desc': ('desc',),
+    'value': ('desc',),
+}
+
+# PRAGMA SQLite appliqués par ogr2ogr pendant le chargement des données
+# (fast_mode : ni journal ni synchronisation, verrou exclusif). page_size n'a
+# d'effet qu'à la création du fichier : pages de 64 Kio, arbres B moins
+# profonds pour les géométries volumineuses. cache_size est ajouté selon
+# le cache choisi (voir _sqlite_load_pragmas())
+_OGR2OGR_SQLITE_PRAGMA = 'page_size=65536,synchronous=NORMAL,temp_store=MEMORY'
+_OGR2OGR_SQLITE_PRAGMA_FAST = (
+    'page_size=65536,journal_mode=OFF,synchronous=OFF,'
+    'temp_store=MEMORY,locking_mode=EXCLUSIVE'
+)
+
+# Cache SQLite (Mo) pendant le chargement si la mémoire disponible est
+# inconnue (sinon ajusté par _auto_cache_mb() ou --cache-mb)
+_SQLITE_CACHE_MB = 256
+_SQLITE_CACHE_MB_FAST = 512
+_SQLITE_CACHE_MB_MIN = 64
+
+# PRAGMA appliqués à la base après conversion (_optimize_spatialite_database)
+_OPTIMIZE_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",  # Au lieu de FULL
+    "PRAGMA journal_mode = WAL",   # Write-Ahead Logging (plus rapide)
+    "PRAGMA cache_size = -256000",  # 256MB de cache
+    "PRAGMA temp_store = MEMORY",   # Tables temporaires en mémoire
+    "PRAGMA mmap_size = 268435456",  # Lecture par mmap (256MB), sans copie
+    "PRAGMA wal_autocheckpoint = 10000",  # Checkpoints WAL moins fréquents
+)
+_OPTIMIZE_PRAGMAS_FAST = (
+    "PRAGMA synchronous = OFF",  # Désactiver complètement
+    "PRAGMA journal_mode = OFF",  # Désactiver le journal
+    "PRAGMA cache_size = -512000",  # 512MB de cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Formats de sortie (--output-format) ; en Parquet, un fichier par couche
+# dans le dossier de sortie, compressé en ZSTD par grands groupes de lignes
+_OUTPUT_FORMATS = ('sqlite', 'parquet')
+_PARQUET_LAYER_OPTIONS = ('COMPRESSION=ZSTD', 'ROW_GROUP_SIZE=1048576')
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w.-]')
+
+# Version de GDAL dans la sortie de "ogr2ogr --version" (ex: "GDAL 3.8.4, released ...")
+_GDAL_VERSION_RE = re.compile(r'GDAL (\d+)\.(\d+)')
+
+# Nombre d'entités par lot Arrow lors de la copie avec l'API Python
+_ARROW_BATCH_SIZE = 65536
+
+# Nombre d'entités écrites par transaction (ogr2ogr -gt et API Python)
+_TRANSACTION_SIZE = 100000
+
+# Fichier de cache des domaines parsés, persisté dans le dossier .gdb
+# (la version invalide les caches écrits avec une autre dérivation des codes)
+_DOMAINS_CACHE_FILENAME = '.domains.cache'
+_DOMAINS_CACHE_VERSION = 1
+
+# Niveau d'un message de sortie ogr2ogr (lignes brutes en octets)
+_LINE_LEVEL_RE = re.compile(rb'\b(ERROR|WARN(?:ING)?)\b', re.IGNORECASE)
+
+# Clés d'alias dans les métadonnées de couche :
+# FIELD_{i}_ALIAS, FIELD_ALIAS_{i}, ALIAS_{champ}, {champ}_ALIAS
+_LAYER_ALIAS_KEY_RE = re.compile(r'^(?:FIELD_(\d+)_ALIAS|FIELD_ALIAS_(\d+)|ALIAS_(.+)|(.+)_ALIAS)$')
+
+# Suffixe des clés d'alias dans les métadonnées du datasource, après le préfixe
+# "{couche}." ou "GDB_{couche}." : FIELD_{i}.ALIAS ou {champ}.ALIAS
+_DS_ALIAS_SUFFIX_RE = re.compile(r'(?:FIELD_(\d+)|([^.]+))\.ALIAS$')
+
+
+def _available_memory() -> Optional[int]:
+    """
+    Retourne la mémoire disponible en octets.
+    
+    MemAvailable (Linux) compte le cache de pages récupérable, contrairement
+    aux pages libres de sysconf qui sous-estiment fortement la mémoire
+    utilisable sur une machine qui a déjà lu des fichiers.
+    
+    Returns:
+        Mémoire disponible, ou None si elle est inconnue
+    """
+    try:
+        with open('/proc/meminfo', 'rb') as meminfo:
+            for line in meminfo:
+                if line.startswith(b'MemAvailable:'):
+                    return int(line.split()[1]) * 1024  # Valeur en kB
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None  # Plateforme sans sysconf (Windows)
+
+
+def _auto_cache_mb(gdb_path: Path) -> Optional[int]:
+    """
+    Calcule la taille du cache SQLite de chargement adaptée à la conversion.
+    
+    Le quart de la mémoire disponible, sans dépasser la taille de la
+    géodatabase (la base produite est du même ordre de grandeur).
+    
+    Args:
+        gdb_path: Chemin vers le dossier .gdb
+        
+    Returns:
+        Taille en Mo, ou None si la mémoire disponible est inconnue
+    """
+    available = _available_memory()
+    if available is None:
+        return None
+    try:
+        gdb_size = sum(entry.stat().st_size for entry in os.scandir(gdb_path) if entry.is_file())
+    except OSError:
+        gdb_size = available
+    return max(_SQLITE_CACHE_MB_MIN, min(available // 4, gdb_size) // (1024 * 1024))
+
+
+def _quote_identifier(name: str) -> str:
+    """Entoure un nom de table, de colonne ou d'index de guillemets pour une requête SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _set_spatialite_blob_srid(blob, srid: int):
+    """
+    Remplace le SRID inscrit dans une géométrie SpatiaLite (BLOB-Geometry).
+    
+    Args:
+        blob: Géométrie (les valeurs qui ne sont pas au format SpatiaLite
+              sont renvoyées telles quelles)
+        srid: Nouveau SRID
+        
+    Returns:
+        Géométrie modifiée
+    """
+    # Octet 0 : 0x00, octet 1 : ordre des octets, 2-5 : SRID, 38 : 0x7C, dernier : 0xFE
+    if not isinstance(blob, bytes) or len(blob) < 44 or blob[0] != 0x00 \
+            or blob[38] != 0x7C or blob[-1] != 0xFE:
+        return blob
+    byte_order = '<' if blob[1] == 0x01 else '>'
+    return blob[:2] + struct.pack(f'{byte_order}i', srid) + blob[6:]
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_ogr2ogr(ogr2ogr_path: str) -> Optional[str]:
+    """
+    Lit la version d'un exécutable ogr2ogr (une seule fois par chemin).
+    
+    Args:
+        ogr2ogr_path: Chemin de l'exécutable (résolu par shutil.which)
+        
+    Returns:
+        Première ligne de `ogr2ogr --version`, ou None si l'appel échoue
+    """
+    try:
+        result = subprocess.run([ogr2ogr_path, '--version'], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    return result.stdout.decode(errors='replace').strip().split('\n')[0]
+
 
 class ProcessMonitor:
     """
     Gestionnaire de monitoring de processus.
     
     Encapsule la logique de monitoring d'un processus subprocess avec :
-    - Lecture de sortie dans un thread séparé
+    - Lecture de sortie non bloquante (selectors + os.read) dans la boucle de monitoring
+      (thread de lecture dédié sous Windows, où les pipes ne sont pas sélectionnables)
     - Monitoring périodique avec timeouts
     - Affichage des messages de statut
     - Détection de blocage
@@ -72,73 +308,158 @@ class ProcessMonitor:
         self.no_output_timeout = no_output_timeout
         self.status_interval = status_interval
         
-        self.output_lines = []
-        self.output_lock = threading.Lock()
+        # Dernières lignes brutes seulement (message d'erreur, décodées à la demande) ;
+        # deque.append/len sont atomiques sous le GIL, aucun verrou n'est nécessaire
+        self.output_lines = deque(maxlen=10)
+        self._line_count = 0  # Nombre total de lignes reçues
         self.reading_done = threading.Event()
         self.reader_thread = None
+        self._activity = threading.Event()  # Signalé à chaque nouvelle ligne (mode thread)
+        self._selector = None  # Sélecteur sur le pipe de sortie (mode sans thread)
+        self._pending = bytearray()  # Ligne incomplète en attente du prochain bloc
+    
+    def _handle_line(self, raw_line: bytes):
+        """
+        Enregistre et journalise une ligne de sortie.
+        
+        Args:
+            raw_line: Ligne brute (octets, sans saut de ligne)
+        """
+        raw_line = raw_line.strip()
+        if not raw_line:
+            return
+        self.output_lines.append(raw_line)
+        self._line_count += 1
+        # Filtrer les messages de progression (classification sans copie en majuscules) ;
+        # les lignes ordinaires ne sont décodées que si le mode verbeux les affiche
+        level = _LINE_LEVEL_RE.search(raw_line)
+        if level is None:
+            if self.logger.verbose:
+                self.logger.debug(f"[{self.layer_name}] {raw_line.decode('utf-8', errors='replace')}")
+        elif level.group(1)[:1] in b'Ee':
+            self.logger.error(f"[{self.layer_name}] {raw_line.decode('utf-8', errors='replace')}")
+        else:
+            self.logger.warning(f"[{self.layer_name}] {raw_line.decode('utf-8', errors='replace')}")
     
     def _read_output(self):
-        """Lit la sortie dans un thread séparé pour éviter les blocages."""
+        """Lit la sortie dans un thread séparé (plateformes sans sélection sur pipe)."""
         try:
-            for line in self.process.stdout:
-                line = line.strip()
-                if line:
-                    with self.output_lock:
-                        self.output_lines.append(line)
-                    # Filtrer les messages de progression
-                    if 'ERROR' in line.upper():
-                        self.logger.error(f"[{self.layer_name}] {line}")
-                    elif 'WARNING' in line.upper():
-                        self.logger.warning(f"[{self.layer_name}] {line}")
-                    else:
-                        self.logger.debug(f"[{self.layer_name}] {line}")
+            stream = getattr(self.process.stdout, 'buffer', self.process.stdout)
+            for raw_line in stream:
+                self._handle_line(raw_line)
+                self._activity.set()
         except Exception as e:
             self.logger.debug(f"[{self.layer_name}] Erreur lors de la lecture: {e}")
         finally:
             self.reading_done.set()
+            self._activity.set()
+    
+    def _read_available(self, timeout: float):
+        """
+        Attend que la sortie soit lisible puis traite les lignes complètes reçues.
+        
+        Args:
+            timeout: Durée maximale d'attente en secondes
+        """
+        if not self._selector.select(timeout=timeout):
+            return
+        try:
+            chunk = os.read(self.process.stdout.fileno(), 65536)
+        except OSError as e:
+            self.logger.debug(f"[{self.layer_name}] Erreur lors de la lecture: {e}")
+            chunk = b''
+        
+        self.feed(chunk)
+        if not chunk:
+            self._selector.close()
+            self.reading_done.set()
+    
+    def feed(self, chunk: bytes):
+        """
+        Traite un bloc de sortie brut (lignes complètes uniquement).
+        
+        Args:
+            chunk: Octets lus sur la sortie ; un bloc vide signale la fin de
+                   la sortie (la dernière ligne sans saut de ligne est traitée)
+        """
+        if not chunk:
+            self._handle_line(bytes(self._pending))
+            self._pending.clear()
+            return
+        
+        self._pending += chunk
+        end = self._pending.rfind(b'\n')
+        if end < 0:
+            return
+        for raw_line in bytes(self._pending[:end]).split(b'\n'):
+            self._handle_line(raw_line)
+        del self._pending[:end + 1]
     
     def start_monitoring(self):
         """Démarre le monitoring du processus."""
+        if os.name != 'nt':
+            try:
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self.process.stdout, selectors.EVENT_READ)
+                return
+            except (OSError, ValueError) as e:
+                self.logger.debug(f"[{self.layer_name}] Sélecteur indisponible ({e}), lecture par thread")
+                self._selector = None
+        
         self.reader_thread = threading.Thread(target=self._read_output, daemon=True)
         self.reader_thread.start()
     
+    def communicate(self) -> Tuple[list, int]:
+        """
+        Attend la fin du processus et lit sa sortie d'un seul bloc.
+        
+        Sans -progress, ogr2ogr n'écrit que ses avertissements et erreurs :
+        le monitoring ligne par ligne n'apporte rien.
+        
+        Returns:
+            Tuple (output_lines, return_code), lignes en octets non décodés
+        """
+        output, errors = self.process.communicate()
+        for raw_line in ((output or b'') + (errors or b'')).splitlines():
+            self._handle_line(raw_line)
+        return (list(self.output_lines), self.process.returncode)
+    
     def wait_for_completion(self) -> Tuple[list, int]:
         """
         Attend la fin du processus avec monitoring.
         
         Returns:
-            Tuple (output_lines, return_code)
+            Tuple (output_lines, return_code), lignes en octets non décodés
         """
         start_time = time.time()
         last_output_count = 0
-        last_output_time = time.time()
-        last_status_time = time.time()
-        
-        # Polling adaptatif : commencer avec 0.1s, augmenter progressivement
-        poll_interval = 0.1  # 100ms pour réactivité
-        max_poll_interval = 1.0  # Max 1 seconde
-        stable_count = 0  # Compteur de stabilité (pas de nouveau output)
+        last_output_time = start_time
+        last_status_time = start_time
         
         while self.process.poll() is None:
-            time.sleep(poll_interval)
+            # Dormir jusqu'à la prochaine échéance (statut ou blocage), réveillé
+            # plus tôt par une nouvelle sortie ou la fin de la lecture
+            timeout = max(0.0, min(last_status_time + self.status_interval,
+                                   last_output_time + self.no_output_timeout) - time.time())
+            if self.reading_done.is_set():
+                # Sortie fermée : attendre directement la fin du processus
+                try:
+                    self.process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    pass
+            elif self._selector is not None:
+                self._read_available(timeout)
+            else:
+                self._activity.wait(timeout=timeout)
+                self._activity.clear()
             current_time = time.time()
             
             # Vérifier si on a reçu de nouvelles lignes
-            with self.output_lock:
-                current_line_count = len(self.output_lines)
-                has_new_output = current_line_count > last_output_count
+            current_line_count = self._line_count
             
-            if has_new_output:
+            if current_line_count > last_output_count:
                 last_output_count = current_line_count
                 last_output_time = current_time
-                stable_count = 0
-                # Réduire l'intervalle de polling si on a du nouveau output
-                poll_interval = max(0.1, poll_interval * 0.9)
-            else:
-                stable_count += 1
-                # Augmenter progressivement l'intervalle si stable
-                if stable_count > 10:  # Après 10 vérifications sans nouveau output
-                    poll_interval = min(max_poll_interval, poll_interval * 1.1)
             
             # Afficher un message de statut périodiquement
             elapsed = current_time - start_time
@@ -153,7 +474,7 @@ class ProcessMonitor:
             
             # Vérifier si le processus semble bloqué
             elapsed_since_output = current_time - last_output_time
-            if elapsed_since_output > self.no_output_timeout:
+            if elapsed_since_output >= self.no_output_timeout:
                 if self.process.poll() is None:
                     elapsed_str = self.logger.format_time(elapsed)
                     self.logger.debug(
@@ -161,15 +482,24 @@ class ProcessMonitor:
                     )
                     last_output_time = current_time
         
-        # Attendre que la lecture soit terminée (max 10 secondes)
-        self.reading_done.wait(timeout=10.0)
-        
-        # Attendre le thread de lecture
-        if self.reader_thread:
-            self.reader_thread.join(timeout=2.0)
+        if self._selector is not None:
+            # Vider la sortie restante (max 10 secondes)
+            deadline = time.time() + 10.0
+            while not self.reading_done.is_set():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self._selector.close()
+                    break
+                self._read_available(remaining)
+        else:
+            # Attendre que la lecture soit terminée (max 10 secondes)
+            self.reading_done.wait(timeout=10.0)
+            
+            # Attendre le thread de lecture
+            if self.reader_thread:
+                self.reader_thread.join(timeout=2.0)
         
-        with self.output_lock:
-            return (self.output_lines.copy(), self.process.returncode)
+        return (list(self.output_lines), self.process.returncode)
 
 
 class GDBMetadataExtractor:
@@ -179,6 +509,18 @@ class GDBMetadataExtractor:
     Responsabilité unique : extraction des métadonnées (alias, domaines, clés primaires, triggers).
     """
     
+    # Domaines déjà chargés dans ce processus, partagés entre instances (clé : chemin GDB)
+    _shared_domains: Dict[str, Dict[str, Dict[int, str]]] = {}
+    _shared_domains_lock = Lock()
+    
+    # Méthode d'extraction par type de métadonnées (clés de extract_all_metadata())
+    METADATA_EXTRACTORS = {
+        'field_aliases': 'extract_field_aliases',
+        'domain_values': 'extract_domain_values',
+        'primary_keys': 'extract_primary_keys',
+        'triggers': 'extract_triggers',
+    }
+    
     def __init__(self, gdb_path: Path, logger: 'ProgressLogger'):
         """
         Initialise l'extracteur.
@@ -187,27 +529,79 @@ class GDBMetadataExtractor:
             gdb_path: Chemin vers la géodatabase
             logger: Logger pour les messages
         """
+        _ensure_gdal()
         self.gdb_path = gdb_path
         self.logger = logger
         self._catalog_cache = None  # Cache pour le fichier catalogue trouvé
         self._domains_cache = None  # Cache pour les domaines chargés
-        self._datasource_cache = None  # Cache pour la datasource GDAL (réutilisation)
+        self._thread_local = threading.local()  # Datasource GDAL par thread (réutilisation)
+        self._datasources = []  # Toutes les datasources ouvertes (pour close())
+        self._datasources_lock = Lock()
+        self._file_scores: Dict[Path, Tuple[bool, int]] = {}  # Cache des scores par fichier .gdbtable
+        self._domain_tables: Optional[List[str]] = None  # Tables de domaine candidates (cherchées une fois)
+        self._domain_table_columns: Dict[str, Optional[Tuple[str, str, str]]] = {}  # Colonnes par table de domaine
+        self._metadata_cache: Dict[str, Dict] = {}  # Métadonnées complètes par couche
     
-    def _get_datasource(self):
+    def get_datasource(self):
         """
         Obtient ou crée la datasource GDAL avec cache pour réutilisation.
         
+        Les datasources OGR ne sont pas thread-safe : chaque thread ouvre
+        et réutilise sa propre datasource en lecture seule.
+        
         Returns:
             Datasource OGR ou None
         """
-        if self._datasource_cache is None:
+        datasource = getattr(self._thread_local, 'datasource', None)
+        if datasource is None:
             try:
                 driver = ogr.GetDriverByName("OpenFileGDB")
-                self._datasource_cache = driver.Open(str(self.gdb_path), 0)
+                datasource = driver.Open(str(self.gdb_path), 0)
             except Exception as e:
                 self.logger.debug(f"Erreur lors de l'ouverture de la datasource: {e}")
                 return None
-        return self._datasource_cache
+            self._thread_local.datasource = datasource
+            with self._datasources_lock:
+                self._datasources.append(datasource)
+        return datasource
+    
+    def get_layer(self, layer_name: str):
+        """
+        Obtient une couche de la géodatabase, avec cache par thread.
+        
+        Évite de rechercher la couche dans la datasource à chaque extraction.
+        
+        Args:
+            layer_name: Nom de la couche
+            
+        Returns:
+            Couche OGR ou None
+        """
+        layers = getattr(self._thread_local, 'layers', None)
+        if layers is None:
+            layers = self._thread_local.layers = {}
+        
+        layer = layers.get(layer_name)
+        if layer is None:
+            datasource = self.get_datasource()
+            if datasource is None:
+                return None
+            layer = datasource.GetLayerByName(layer_name)
+            if layer is not None:
+                layers[layer_name] = layer
+        return layer
+    
+    def close(self):
+        """
+        Libère les datasources GDAL ouvertes par tous les threads.
+        
+        L'extracteur reste utilisable : une nouvelle datasource sera ouverte
+        au prochain appel.
+        """
+        with self._datasources_lock:
+            self._datasources = []
+        # Remplacer le stockage local libère la référence de chaque thread
+        self._thread_local = threading.local()
     
     def extract_field_aliases(self, layer_name: str) -> Dict[str, str]:
         """
@@ -221,14 +615,28 @@ class GDBMetadataExtractor:
         """
         aliases = {}
         try:
-            datasource = self._get_datasource()
+            datasource = self.get_datasource()
             if datasource is None:
                 return aliases
             
-            layer = datasource.GetLayerByName(layer_name)
+            layer = self.get_layer(layer_name)
             if layer is None:
                 return aliases
             
+            # Lire les métadonnées une seule fois (hors de la boucle des champs)
+            try:
+                layer_metadata = layer.GetMetadata() or {}
+            except RuntimeError:
+                layer_metadata = {}
+            try:
+                ds_metadata = datasource.GetMetadata() or {}
+            except RuntimeError:
+                ds_metadata = {}
+            alias_by_index, alias_by_name = self._index_layer_alias_metadata(layer_metadata)
+            ds_alias_by_index, ds_alias_by_name = self._index_datasource_alias_metadata(
+                ds_metadata, layer_name
+            )
+            
             layer_def = layer.GetLayerDefn()
             for i in range(layer_def.GetFieldCount()):
                 field_def = layer_def.GetFieldDefn(i)
@@ -238,60 +646,28 @@ class GDBMetadataExtractor:
                 alias = None
                 
                 # Méthode 1 : GetAlternativeNameRef() (si disponible dans GDAL 3.0+)
-                try:
-                    if hasattr(field_def, 'GetAlternativeNameRef'):
+                if hasattr(field_def, 'GetAlternativeNameRef'):
+                    try:
                         alias = field_def.GetAlternativeNameRef()
-                except:
-                    pass
+                    except RuntimeError:
+                        pass
                 
-                # Méthode 2 : Métadonnées de la couche
+                # Méthode 2 : Métadonnées de la couche (index pré-calculé)
                 if not alias:
-                    try:
-                        metadata = layer.GetMetadata()
-                        if metadata:
-                            # Essayer différentes clés possibles
-                            possible_keys = [
-                                f"FIELD_{i}_ALIAS",
-                                f"{field_name}_ALIAS",
-                                f"ALIAS_{field_name}",
-                                f"FIELD_ALIAS_{i}"
-                            ]
-                            for key in possible_keys:
-                                if key in metadata:
-                                    alias = metadata[key]
-                                    break
-                    except:
-                        pass
+                    alias = alias_by_index.get(i) or alias_by_name.get(field_name)
                 
-                # Méthode 3 : Métadonnées du datasource
+                # Méthode 3 : Métadonnées du datasource (index pré-calculé)
                 if not alias:
-                    try:
-                        ds_metadata = datasource.GetMetadata()
-                        if ds_metadata:
-                            possible_keys = [
-                                f"{layer_name}.{field_name}.ALIAS",
-                                f"{layer_name}.FIELD_{i}.ALIAS",
-                                f"GDB_{layer_name}.{field_name}.ALIAS"
-                            ]
-                            for key in possible_keys:
-                                if key in ds_metadata:
-                                    alias = ds_metadata[key]
-                                    break
-                    except:
-                        pass
+                    alias = ds_alias_by_name.get(field_name) or ds_alias_by_index.get(i)
                 
                 # Méthode 4 : Métadonnées du champ directement
-                if not alias:
+                if not alias and hasattr(field_def, 'GetMetadata'):
                     try:
-                        if hasattr(field_def, 'GetMetadata'):
-                            field_metadata = field_def.GetMetadata()
-                            if field_metadata:
-                                if 'ALIAS' in field_metadata:
-                                    alias = field_metadata['ALIAS']
-                                elif 'ALTERNATIVE_NAME' in field_metadata:
-                                    alias = field_metadata['ALTERNATIVE_NAME']
-                    except:
-                        pass
+                        field_metadata = field_def.GetMetadata()
+                    except RuntimeError:
+                        field_metadata = None
+                    if field_metadata:
+                        alias = field_metadata.get('ALIAS') or field_metadata.get('ALTERNATIVE_NAME')
                 
                 if alias and alias != field_name:
                     aliases[field_name] = alias
@@ -303,6 +679,72 @@ class GDBMetadataExtractor:
         
         return aliases
     
+    @staticmethod
+    def _index_layer_alias_metadata(metadata: Dict[str, str]) -> Tuple[Dict[int, str], Dict[str, str]]:
+        """
+        Indexe en une seule passe les alias présents dans les métadonnées de couche.
+        
+        Les clés FIELD_{i}_ALIAS et {champ}_ALIAS sont prioritaires sur
+        FIELD_ALIAS_{i} et ALIAS_{champ}.
+        
+        Args:
+            metadata: Métadonnées de la couche
+            
+        Returns:
+            Tuple ({index_champ: alias}, {nom_champ: alias})
+        """
+        by_index = {}
+        by_name = {}
+        for key, value in metadata.items():
+            match = _LAYER_ALIAS_KEY_RE.match(key)
+            if not match:
+                continue
+            index_first, index_second, name_second, name_first = match.groups()
+            if index_first is not None:
+                by_index[int(index_first)] = value
+            elif index_second is not None:
+                by_index.setdefault(int(index_second), value)
+            elif name_first is not None:
+                by_name[name_first] = value
+            else:
+                by_name.setdefault(name_second, value)
+        return by_index, by_name
+    
+    @staticmethod
+    def _index_datasource_alias_metadata(metadata: Dict[str, str],
+                                         layer_name: str) -> Tuple[Dict[int, str], Dict[str, str]]:
+        """
+        Indexe en une seule passe les alias d'une couche dans les métadonnées du datasource.
+        
+        Clés reconnues : {couche}.{champ}.ALIAS, {couche}.FIELD_{i}.ALIAS et
+        GDB_{couche}.{champ}.ALIAS (cette dernière étant la moins prioritaire).
+        
+        Args:
+            metadata: Métadonnées du datasource
+            layer_name: Nom de la couche
+            
+        Returns:
+            Tuple ({index_champ: alias}, {nom_champ: alias})
+        """
+        prefix = f"{layer_name}."
+        gdb_prefix = f"GDB_{layer_name}."
+        by_index = {}
+        by_name = {}
+        for key, value in metadata.items():
+            if key.startswith(prefix):
+                match = _DS_ALIAS_SUFFIX_RE.match(key, len(prefix))
+                if match:
+                    index, name = match.groups()
+                    if index is not None:
+                        by_index[int(index)] = value
+                    else:
+                        by_name[name] = value
+            elif key.startswith(gdb_prefix):
+                match = _DS_ALIAS_SUFFIX_RE.match(key, len(gdb_prefix))
+                if match and match.group(2) is not None:
+                    by_name.setdefault(match.group(2), value)
+        return by_index, by_name
+    
     def extract_domain_values(self, layer_name: str) -> Dict[str, Dict[int, str]]:
         """
         Extrait les domaines codés (alias de valeurs) pour une couche.
@@ -311,15 +753,16 @@ class GDBMetadataExtractor:
             layer_name: Nom de la couche
             
         Returns:
-            Dictionnaire {nom_champ: {code: description}}
+            Dictionnaire {nom_champ: {code: description}} (les dictionnaires de
+            valeurs issus du catalogue sont partagés : à traiter en lecture seule)
         """
         domains = {}
         try:
-            datasource = self._get_datasource()
+            datasource = self.get_datasource()
             if datasource is None:
                 return domains
             
-            layer = datasource.GetLayerByName(layer_name)
+            layer = self.get_layer(layer_name)
             if layer is None:
                 return domains
             
@@ -328,54 +771,57 @@ class GDBMetadataExtractor:
             # Charger tous les domaines depuis le fichier catalogue (une seule fois)
             all_domains = self._load_domains_from_catalog()
             
+            # Instantané des champs : un seul passage par les bindings GDAL
+            fields = []
             for i in range(layer_def.GetFieldCount()):
                 field_def = layer_def.GetFieldDefn(i)
-                field_name = field_def.GetName()
-                
-                # Essayer d'extraire le domaine codé
-                domain_values = {}
+                domain_name = field_def.GetDomainName() if hasattr(field_def, 'GetDomainName') else None
+                fields.append((field_def, field_def.GetName(), domain_name))
+            
+            for field_def, field_name, domain_name in fields:
+                if not domain_name:
+                    continue
                 
-                try:
-                    # Méthode 1 : GetDomainName() et lookup dans le catalogue XML
-                    domain_name = None
-                    if hasattr(field_def, 'GetDomainName'):
-                        domain_name = field_def.GetDomainName()
+                # Méthode 1 : Extraire depuis le fichier catalogue XML (prioritaire, cas courant)
+                # Partagé avec le cache des domaines : lecture seule
+                domain_values = all_domains.get(domain_name)
+                if domain_values:
+                    self.logger.debug(
+                        f"  Domaine {domain_name} trouvé dans le catalogue: "
+                        f"{len(domain_values)} valeurs avec descriptions"
+                    )
+                else:
+                    # Méthodes de repli, seulement si le domaine est absent du catalogue
+                    # (chaque méthode gère ses propres erreurs)
+                    # Méthode 2 : Chercher dans les tables de domaine (codes et descriptions)
+                    if self._domain_tables is None:
+                        self._domain_tables = self._find_domain_tables(datasource)
+                    domain_values = self._extract_from_domain_table(
+                        datasource, domain_name, self._domain_tables
+                    )
+                    
+                    # Méthode 3 : Chercher dans les métadonnées de la couche
+                    if not domain_values:
+                        domain_values = self._extract_from_layer_metadata(
+                            layer, field_name, domain_name
+                        )
                     
-                    if domain_name:
-                        # Méthode 1 : Extraire depuis le fichier catalogue XML (prioritaire)
-                        if domain_name in all_domains:
-                            domain_values = all_domains[domain_name].copy()
-                            self.logger.debug(
-                                f"  Domaine {domain_name} trouvé dans le catalogue: "
-                                f"{len(domain_values)} valeurs avec descriptions"
-                            )
-                        
-                        # Méthode 2 : Chercher dans les métadonnées de la couche
-                        if not domain_values:
-                            domain_values = self._extract_from_layer_metadata(
-                                layer, field_name, domain_name
-                            )
-                        
-                        # Méthode 3 : Chercher dans les métadonnées du datasource
-                        if not domain_values:
-                            domain_values = self._extract_from_datasource_metadata(
-                                datasource, layer_name, field_name, domain_name
-                            )
-                        
-                        # Méthode 4 : Chercher dans les métadonnées du champ
-                        if not domain_values and hasattr(field_def, 'GetMetadata'):
-                            domain_values = self._extract_from_field_metadata(field_def)
-                        
-                        # Méthode 5 : Extraire les valeurs uniques depuis les données
-                        # (sans descriptions, mais on peut au moins avoir les codes)
-                        if not domain_values:
-                            domain_values = self._extract_unique_values_from_data(
-                                layer, field_name, field_def
-                            )
+                    # Méthode 4 : Chercher dans les métadonnées du datasource
+                    if not domain_values:
+                        domain_values = self._extract_from_datasource_metadata(
+                            datasource, layer_name, field_name, domain_name
+                        )
                     
-                except Exception as e:
-                    self.logger.debug(f"Erreur extraction domaine pour {field_name}: {e}")
-                    pass
+                    # Méthode 5 : Chercher dans les métadonnées du champ
+                    if not domain_values and hasattr(field_def, 'GetMetadata'):
+                        domain_values = self._extract_from_field_metadata(field_def)
+                    
+                    # Méthode 6 : Extraire les valeurs uniques depuis les données
+                    # (sans descriptions, mais on peut au moins avoir les codes)
+                    if not domain_values:
+                        domain_values = self._extract_unique_values_from_data(
+                            layer, field_name, field_def
+                        )
                 
                 if domain_values:
                     domains[field_name] = domain_values
@@ -398,7 +844,10 @@ class GDBMetadataExtractor:
         Référence : https://pro.arcgis.com/en/pro-app/latest/help/data/geodatabases/overview/the-architecture-of-a-geodatabase.htm
         
         Utilise une découverte automatique du fichier catalogue et un parsing robuste.
-        Met en cache le résultat pour éviter de re-scanner les fichiers.
+        Met en cache le résultat pour éviter de re-scanner les fichiers : en mémoire
+        (partagé entre instances pour une même géodatabase) et sur disque dans
+        le fichier .domains.cache du dossier .gdb, invalidé dès que le fichier
+        catalogue change (date de modification ou taille).
         
         Returns:
             Dictionnaire {nom_domaine: {code: description}}
@@ -407,58 +856,142 @@ class GDBMetadataExtractor:
         if self._domains_cache is not None:
             return self._domains_cache
         
+        # Domaines déjà chargés par une autre instance pour la même géodatabase
+        shared_key = str(self.gdb_path.resolve())
+        with self._shared_domains_lock:
+            shared_domains = self._shared_domains.get(shared_key)
+        if shared_domains is not None:
+            self._domains_cache = shared_domains
+            return shared_domains
+        
         all_domains = {}
         
         try:
-            # Découvrir automatiquement le fichier catalogue (avec cache)
-            if self._catalog_cache is None:
-                catalog_file = self._find_domain_catalog_file()
-                self._catalog_cache = catalog_file
-            else:
-                catalog_file = self._catalog_cache
-            
-            if not catalog_file:
-                self.logger.debug("Aucun fichier catalogue de domaines trouvé")
-                self._domains_cache = {}  # Mettre en cache même si vide
-                return all_domains
-            
-            self.logger.debug(f"Fichier catalogue trouvé: {catalog_file.name}")
-            
-            # Lire le fichier
-            try:
-                with open(catalog_file, 'rb') as f:
-                    data = f.read()
-            except IOError as e:
-                self.logger.debug(f"Erreur lors de la lecture du fichier catalogue: {e}")
-                self._domains_cache = {}  # Cache vide en cas d'erreur
-                return all_domains
-            
-            # Décoder en texte (UTF-8 avec tolérance pour les erreurs)
-            try:
-                text = data.decode('utf-8', errors='ignore')
-            except Exception as e:
-                self.logger.debug(f"Erreur lors du décodage du fichier: {e}")
-                self._domains_cache = {}  # Cache vide en cas d'erreur
-                return all_domains
-            
-            # Parser les domaines depuis le XML
-            all_domains = self._parse_domains_from_xml(text)
-            
-            # Mettre en cache le résultat
-            self._domains_cache = all_domains
-            
-            if all_domains:
+            # Domaines persistés lors d'une exécution précédente
+            cached = self._read_domains_cache_file()
+            if cached is not None:
+                catalog_name, all_domains = cached
                 self.logger.info(
-                    f"✓ {len(all_domains)} domaine(s) chargé(s) depuis le catalogue XML "
-                    f"({catalog_file.name})"
+                    f"✓ {len(all_domains)} domaine(s) chargé(s) depuis le cache "
+                    f"({catalog_name})"
                 )
+            else:
+                all_domains = self._parse_domain_catalog()
         
         except Exception as e:
             self.logger.debug(f"Erreur lors du chargement des domaines depuis le catalogue: {e}")
-            self._domains_cache = {}  # Cache vide en cas d'erreur
+            all_domains = {}  # Cache vide en cas d'erreur
+        
+        # Mettre en cache le résultat (même si vide)
+        self._domains_cache = all_domains
+        with self._shared_domains_lock:
+            self._shared_domains[shared_key] = all_domains
+        
+        return all_domains
+    
+    def _parse_domain_catalog(self) -> Dict[str, Dict[int, str]]:
+        """
+        Découvre le fichier catalogue, parse ses domaines et persiste le résultat.
+        
+        Returns:
+            Dictionnaire {nom_domaine: {code: description}}
+        """
+        # Découvrir automatiquement le fichier catalogue (avec cache)
+        if self._catalog_cache is None:
+            catalog_file = self._find_domain_catalog_file()
+            self._catalog_cache = catalog_file
+        else:
+            catalog_file = self._catalog_cache
+        
+        if not catalog_file:
+            self.logger.debug("Aucun fichier catalogue de domaines trouvé")
+            return {}
+        
+        self.logger.debug(f"Fichier catalogue trouvé: {catalog_file.name}")
+        
+        # Projeter le fichier en mémoire et parser les domaines directement
+        # sur les octets (pas de copie ni de décodage du fichier complet)
+        try:
+            with open(catalog_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                all_domains = self._parse_domains_from_xml(mm)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Erreur lors de la lecture du fichier catalogue: {e}")
+            return {}
+        
+        if all_domains:
+            self.logger.info(
+                f"✓ {len(all_domains)} domaine(s) chargé(s) depuis le catalogue XML "
+                f"({catalog_file.name})"
+            )
         
+        self._write_domains_cache_file(catalog_file, all_domains)
         return all_domains
     
+    def _read_domains_cache_file(self) -> Optional[Tuple[str, Dict[str, Dict[int, str]]]]:
+        """
+        Lit les domaines persistés si le fichier catalogue n'a pas changé.
+        
+        Le cache est en JSON (et non pickle) : il est lu depuis le dossier .gdb,
+        dont le contenu n'est pas forcément de confiance.
+        
+        Returns:
+            Tuple (nom_fichier_catalogue, {nom_domaine: {code: description}})
+            ou None si le cache est absent, invalide ou périmé
+        """
+        cache_file = self.gdb_path / _DOMAINS_CACHE_FILENAME
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            
+            if payload.get('version') != _DOMAINS_CACHE_VERSION:
+                return None
+            
+            catalog_file = self.gdb_path / Path(payload['catalog']).name
+            catalog_stat = catalog_file.stat()
+            if payload['key'] != [catalog_stat.st_mtime_ns, catalog_stat.st_size]:
+                self.logger.debug("Cache des domaines périmé, nouveau parsing du catalogue")
+                return None
+            
+            all_domains = {
+                domain_name: {int(code): description for code, description in values.items()}
+                for domain_name, values in payload['domains'].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        
+        self._catalog_cache = catalog_file
+        return (catalog_file.name, all_domains)
+    
+    def _write_domains_cache_file(self, catalog_file: Path, all_domains: Dict[str, Dict[int, str]]):
+        """
+        Persiste les domaines parsés, avec la clé d'invalidation du fichier catalogue.
+        
+        Args:
+            catalog_file: Fichier catalogue dont les domaines ont été extraits
+            all_domains: Dictionnaire {nom_domaine: {code: description}}
+        """
+        cache_file = self.gdb_path / _DOMAINS_CACHE_FILENAME
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            catalog_stat = catalog_file.stat()
+            payload = {
+                'version': _DOMAINS_CACHE_VERSION,
+                'catalog': catalog_file.name,
+                'key': [catalog_stat.st_mtime_ns, catalog_stat.st_size],
+                'domains': all_domains,
+            }
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)  # Remplacement atomique
+        except OSError as e:
+            # Géodatabase en lecture seule, etc. : le cache disque est facultatif
+            self.logger.debug(f"Impossible d'écrire le cache des domaines: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+    
     def _find_domain_catalog_file(self) -> Optional[Path]:
         """
         Trouve automatiquement le fichier contenant les définitions de domaines.
@@ -479,32 +1012,32 @@ class GDBMetadataExtractor:
             return None
         
         # Chercher tous les fichiers .gdbtable
-        gdbtable_files = list(self.gdb_path.glob("*.gdbtable"))
+        gdbtable_files = sorted(self.gdb_path.glob("*.gdbtable"))
         
         if not gdbtable_files:
             return None
         
-        # Scanner les fichiers pour trouver celui contenant des domaines
+        # Scanner en parallèle les fichiers pas encore analysés (lecture I/O-bound,
+        # le GIL est relâché pendant les accès disque)
+        to_scan = [f for f in gdbtable_files if f not in self._file_scores]
+        if to_scan:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_scan))) as executor:
+                results = list(executor.map(self._file_contains_domains, to_scan))
+            self._file_scores.update(zip(to_scan, results))
+        
+        # Retenir le fichier contenant le plus de domaines
         best_file = None
         best_score = 0
         
-        for gdbtable_file in sorted(gdbtable_files):
-            try:
-                # Vérifier si le fichier contient des domaines
-                contains_domains, score = self._file_contains_domains(gdbtable_file)
-                
-                if contains_domains and score > best_score:
-                    best_file = gdbtable_file
-                    best_score = score
-                    self.logger.debug(
-                        f"Fichier candidat trouvé: {gdbtable_file.name} "
-                        f"(score: {score})"
-                    )
-            except Exception as e:
+        for gdbtable_file in gdbtable_files:
+            contains_domains, score = self._file_scores[gdbtable_file]
+            if contains_domains and score > best_score:
+                best_file = gdbtable_file
+                best_score = score
                 self.logger.debug(
-                    f"Erreur lors de l'analyse de {gdbtable_file.name}: {e}"
+                    f"Fichier candidat trouvé: {gdbtable_file.name} "
+                    f"(score: {score})"
                 )
-                continue
         
         return best_file
     
@@ -516,6 +1049,8 @@ class GDBMetadataExtractor:
         dans les fichiers .gdbtable. Cette méthode détecte la présence de ces définitions
         en cherchant des patterns XML spécifiques aux domaines codés.
         
+        Sans effet de bord sur l'instance : peut être appelée depuis plusieurs threads.
+        
         Args:
             file_path: Chemin vers le fichier .gdbtable
             
@@ -526,40 +1061,42 @@ class GDBMetadataExtractor:
             return (False, 0)
         
         try:
-            # Lire un échantillon du fichier (premiers 1MB pour éviter de tout charger)
-            with open(file_path, 'rb') as f:
-                sample = f.read(1024 * 1024)  # 1MB
-            
-            # Décoder en texte
-            text = sample.decode('utf-8', errors='ignore')
-            
-            # Chercher des indicateurs de domaines codés
-            indicators = [
-                ('GPCodedValueDomain2', 10),  # Tag principal des domaines codés
-                ('<DomainName>', 5),          # Nom de domaine
-                ('<CodedValue', 3),           # Valeur codée
-                ('<Code>', 2),                # Code
-                ('<Name>', 2),                # Description
-            ]
-            
-            score = 0
-            for indicator, points in indicators:
-                if indicator in text:
-                    score += points
-            
-            # Chercher aussi des patterns de domaines connus
-            import re
-            domain_pattern = r'<GPCodedValueDomain2[^>]*>.*?</GPCodedValueDomain2>'
-            domain_matches = re.findall(domain_pattern, text, re.DOTALL)
-            score += len(domain_matches) * 5  # Bonus pour chaque domaine trouvé
-            
-            # Si le fichier est petit, lire tout pour vérifier
-            if file_path.stat().st_size < 10 * 1024 * 1024:  # < 10MB
-                with open(file_path, 'rb') as f:
-                    full_data = f.read()
-                full_text = full_data.decode('utf-8', errors='ignore')
-                full_domain_matches = re.findall(domain_pattern, full_text, re.DOTALL)
-                score = len(full_domain_matches) * 5
+            file_size = file_path.stat().st_size
+            if file_size == 0:
+                return (False, 0)
+            
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Échantillon : premiers 1MB (recherches directement sur les octets)
+                sample_end = min(file_size, 1024 * 1024)
+                
+                # Chercher des indicateurs de domaines codés
+                indicators = [
+                    (b'GPCodedValueDomain2', 10),  # Tag principal des domaines codés
+                    (b'<DomainName>', 5),          # Nom de domaine
+                    (b'<CodedValue', 3),           # Valeur codée
+                    (b'<Code>', 2),                # Code
+                    (b'<Name>', 2),                # Description
+                ]
+                
+                score = 0
+                for indicator, points in indicators:
+                    if mm.find(indicator, 0, sample_end) != -1:
+                        score += points
+                
+                # Chercher aussi des patterns de domaines connus
+                domain_count = sum(1 for _ in _DOMAIN_BLOCK_RE.finditer(mm, 0, sample_end))
+                score += domain_count * 5  # Bonus pour chaque domaine trouvé
+                
+                # Si le fichier est petit, compter les domaines de tout le fichier
+                if file_size < 10 * 1024 * 1024:  # < 10MB
+                    if sample_end == file_size:
+                        # L'échantillon couvre déjà tout le fichier
+                        score = domain_count * 5
+                    elif 5 <= score < 50:
+                        # Échantillon non concluant (score proche du seuil) : seul
+                        # ce cas justifie une seconde passe sur le fichier complet
+                        score = sum(1 for _ in _DOMAIN_BLOCK_RE.finditer(mm)) * 5
             
             return (score > 20, score)  # Seuil minimal pour considérer comme valide
         
@@ -567,7 +1104,7 @@ class GDBMetadataExtractor:
             self.logger.debug(f"Erreur lors de la vérification de {file_path.name}: {e}")
             return (False, 0)
     
-    def _parse_domains_from_xml(self, xml_content: str) -> Dict[str, Dict[int, str]]:
+    def _parse_domains_from_xml(self, xml_content) -> Dict[str, Dict[int, str]]:
         """
         Parse le contenu XML pour extraire les domaines codés.
         
@@ -575,6 +1112,12 @@ class GDBMetadataExtractor:
         - <DomainName> : Nom du domaine
         - <CodedValues> : Liste de <CodedValue> avec <Code> et <Name>
         
+        Un fichier .gdbtable n'est pas un document XML valide (données binaires
+        entre les enregistrements) : les blocs de domaines sont donc localisés en
+        une seule passe sur les octets, puis chaque bloc est parsé avec lxml
+        (parseur C libxml2). Sans lxml, le parsing par expressions régulières
+        est utilisé en repli.
+        
         Gère :
         - Différents formats XML (avec/sans namespaces, variantes de tags)
         - Erreurs de parsing avec fallback gracieux
@@ -582,34 +1125,28 @@ class GDBMetadataExtractor:
         - Encodages HTML dans les descriptions (&apos;, &quot;, etc.)
         
         Args:
-            xml_content: Contenu XML à parser (extrait depuis les fichiers .gdbtable)
+            xml_content: Contenu brut (bytes ou mmap d'un fichier .gdbtable)
             
         Returns:
             Dictionnaire {nom_domaine: {code: description}}
         """
         all_domains = {}
-        import re
+        
+        parser = None
+        if etree is not None:
+            parser = etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False)
         
         try:
-            # Pattern pour trouver tous les domaines codés
-            # Supporte les variantes avec/sans namespaces
-            domain_patterns = [
-                r'<GPCodedValueDomain2[^>]*>.*?</GPCodedValueDomain2>',
-                r'<GPCodedValueDomain[^>]*>.*?</GPCodedValueDomain>',
-            ]
-            
-            domain_matches = []
-            for pattern in domain_patterns:
-                matches = re.findall(pattern, xml_content, re.DOTALL | re.IGNORECASE)
-                domain_matches.extend(matches)
-            
-            if not domain_matches:
-                return all_domains
-            
             # Parser chaque domaine
-            for domain_xml in domain_matches:
+            for match in _DOMAIN_BLOCK_RE.finditer(xml_content):
+                domain_xml = match.group(0)
                 try:
-                    domain_name, coded_values = self._parse_single_domain(domain_xml)
+                    if parser is not None:
+                        domain_name, coded_values = self._parse_domain_element(domain_xml, parser)
+                    else:
+                        domain_name, coded_values = self._parse_single_domain(
+                            domain_xml.decode('utf-8', errors='ignore')
+                        )
                     if domain_name and coded_values:
                         all_domains[domain_name] = coded_values
                         self.logger.debug(
@@ -624,6 +1161,36 @@ class GDBMetadataExtractor:
         
         return all_domains
     
+    def _parse_domain_element(self, domain_xml: bytes, parser) -> Tuple[Optional[str], Dict[int, str]]:
+        """
+        Parse un seul domaine XML avec lxml.
+        
+        Les entités (&apos;, &quot;, etc.) sont décodées par libxml2.
+        
+        Args:
+            domain_xml: Bloc XML <GPCodedValueDomain2>...</GPCodedValueDomain2>
+            parser: Parseur lxml (mode recover)
+            
+        Returns:
+            Tuple (nom_domaine, {code: description})
+        """
+        element = etree.fromstring(domain_xml, parser)
+        if element is None:
+            return (None, {})
+        
+        domain_name = (element.findtext('{*}DomainName') or '').strip()
+        if not domain_name:
+            return (None, {})
+        
+        coded_values = {}
+        for coded in element.iterfind('.//{*}CodedValue'):
+            code_str = (coded.findtext('{*}Code') or '').strip()
+            description = (coded.findtext('{*}Name') or '').strip()
+            if code_str and description:
+                coded_values[self._convert_code_to_int(code_str)] = description
+        
+        return (domain_name, coded_values)
+    
     def _parse_single_domain(self, domain_xml: str) -> Tuple[Optional[str], Dict[int, str]]:
         """
         Parse un seul domaine XML.
@@ -634,28 +1201,16 @@ class GDBMetadataExtractor:
         Returns:
             Tuple (nom_domaine, {code: description})
         """
-        import re
-        
         # Extraire le nom du domaine
-        name_patterns = [
-            r'<DomainName>([^<]+)</DomainName>',
-            r'<DomainName[^>]*>([^<]+)</DomainName>',
-        ]
-        
-        domain_name = None
-        for pattern in name_patterns:
-            match = re.search(pattern, domain_xml, re.IGNORECASE)
-            if match:
-                domain_name = match.group(1).strip()
-                break
+        match = _DOMAIN_NAME_RE.search(domain_xml)
+        domain_name = match.group(1).strip() if match else None
         
         if not domain_name:
             return (None, {})
         
         # Extraire les valeurs codées
         coded_values = {}
-        coded_pattern = r'<CodedValue[^>]*>.*?</CodedValue>'
-        coded_matches = re.findall(coded_pattern, domain_xml, re.DOTALL | re.IGNORECASE)
+        coded_matches = _CODED_VALUE_RE.findall(domain_xml)
         
         for coded_xml in coded_matches:
             result = self._extract_coded_value(coded_xml)
@@ -681,53 +1236,29 @@ class GDBMetadataExtractor:
         Returns:
             Tuple (code, description) ou None si erreur
         """
-        import re
+        # Extraire le Name (description) et le Code (numérique ou textuel,
+        # quel que soit xsi:type) en une seule recherche
+        match = _CODE_NAME_RE.search(coded_xml)
+        if not match:
+            return None
         
-        try:
-            # Patterns pour extraire le Code
-            code_patterns = [
-                r'<Code[^>]*>([^<]+)</Code>',
-                r'<Code[^>]*xsi:type=[\'"]xs:string[\'"]>([^<]+)</Code>',
-                r'<Code[^>]*xsi:type=[\'"]xs:int[\'"]>([^<]+)</Code>',
-            ]
-            
-            code_str = None
-            for pattern in code_patterns:
-                match = re.search(pattern, coded_xml, re.IGNORECASE)
-                if match:
-                    code_str = match.group(1).strip()
-                    break
-            
-            # Patterns pour extraire le Name (description)
-            name_patterns = [
-                r'<Name>([^<]+)</Name>',
-                r'<Name[^>]*>([^<]+)</Name>',
-            ]
-            
-            description = None
-            for pattern in name_patterns:
-                match = re.search(pattern, coded_xml, re.IGNORECASE)
-                if match:
-                    description = match.group(1).strip()
-                    break
-            
-            if not code_str or not description:
-                return None
-            
-            # Décoder les entités HTML
-            try:
-                description = html.unescape(description)
-            except:
-                pass
-            
-            # Convertir le code en int si possible
-            code = self._convert_code_to_int(code_str)
-            
-            return (code, description)
+        name_first, code_second, code_first, name_second = match.groups()
+        if name_first is not None:
+            description, code_str = name_first.strip(), code_second.strip()
+        else:
+            code_str, description = code_first.strip(), name_second.strip()
         
-        except Exception as e:
-            self.logger.debug(f"Erreur lors de l'extraction d'une valeur codée: {e}")
+        if not code_str or not description:
             return None
+        
+        # Décoder les entités HTML (seulement si une entité est présente)
+        if '&' in description:
+            description = _html_unescape(description)
+        
+        # Convertir le code en int si possible
+        code = self._convert_code_to_int(code_str)
+        
+        return (code, description)
     
     def _convert_code_to_int(self, code_str: str) -> int:
         """
@@ -755,8 +1286,24 @@ class GDBMetadataExtractor:
             return ord(code_str)
         
         # Pour les codes textuels multiples, utiliser un hash déterministe
-        # (hash() peut varier entre les sessions Python, utiliser abs() et modulo)
-        return abs(hash(code_str)) % 1000000
+        return self._stable_code(code_str)
+    
+    @staticmethod
+    def _stable_code(value: str) -> int:
+        """
+        Dérive un code entier stable d'une valeur textuelle.
+        
+        Contrairement à hash(), le résultat est identique d'une session Python
+        à l'autre et d'une machine à l'autre (codes persistés dans Spatialite).
+        
+        Args:
+            value: Valeur textuelle
+            
+        Returns:
+            Code entier dans [0, 1000000)
+        """
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big') % 1000000
     
     def _find_domain_tables(self, datasource) -> list:
         """
@@ -777,10 +1324,11 @@ class GDBMetadataExtractor:
                 layer = datasource.GetLayerByIndex(i)
                 layer_name = layer.GetName()
                 # Chercher les tables qui pourraient contenir des domaines
-                if 'domain' in layer_name.lower() or 'gdb' in layer_name.lower():
+                name_lower = layer_name.lower()
+                if 'domain' in name_lower or 'gdb' in name_lower:
                     domain_tables.append(layer_name)
-        except:
-            pass
+        except RuntimeError as e:
+            self.logger.debug(f"Erreur lors de la recherche des tables de domaine: {e}")
         return domain_tables
     
     def _extract_from_domain_table(self, datasource, domain_name: str, domain_tables: list) -> Dict[int, str]:
@@ -796,66 +1344,133 @@ class GDBMetadataExtractor:
             Dictionnaire {code: description}
         """
         domain_values = {}
-        try:
-            # Essayer de trouver la table de domaine correspondante
-            for table_name in domain_tables:
-                try:
-                    domain_layer = datasource.GetLayerByName(table_name)
-                    if domain_layer:
-                        # Parcourir les entités pour trouver celles du domaine
-                        domain_layer.ResetReading()
-                        feature_def = domain_layer.GetLayerDefn()
-                        for feature in domain_layer:
-                            # Chercher les champs qui pourraient contenir le nom du domaine
-                            feat_domain_name = None
-                            code = None
-                            desc = None
-                            
-                            for j in range(feature_def.GetFieldCount()):
-                                field_def = feature_def.GetFieldDefn(j)
-                                field_name = field_def.GetName().lower()
-                                
-                                # Chercher le nom du domaine
-                                if 'domain' in field_name or 'name' in field_name:
-                                    feat_domain_name = feature.GetFieldAsString(j)
-                                
-                                # Chercher le code
-                                if 'code' in field_name:
-                                    code = feature.GetFieldAsInteger(j)
-                                
-                                # Chercher la description
-                                if 'desc' in field_name or 'value' in field_name or 'name' in field_name:
-                                    desc = feature.GetFieldAsString(j)
-                            
-                            # Si le domaine correspond et qu'on a code et description
-                            if feat_domain_name and domain_name.upper() in feat_domain_name.upper():
-                                if code is not None and desc:
-                                    domain_values[code] = desc
-                except:
-                    continue
-        except:
-            pass
+        
+        # Motif LIKE (insensible à la casse en OGR SQL) : le nom du domaine contenu
+        # dans la colonne de domaine, caractères spéciaux échappés
+        pattern = domain_name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        pattern = pattern.replace("'", "''")
+        
+        # Essayer de trouver la table de domaine correspondante
+        for table_name in domain_tables:
+            domain_layer = self.get_layer(table_name)
+            if domain_layer is None:
+                continue
+            
+            columns = self._get_domain_table_columns(domain_layer)
+            if columns is None:
+                continue
+            domain_col, code_col, desc_col = (_quote_identifier(c) for c in columns)
+            
+            # Filtrer côté GDAL : seules les lignes du domaine sont lues
+            sql = (
+                f"SELECT {code_col}, {desc_col} FROM {_quote_identifier(table_name)} "
+                f"WHERE {domain_col} LIKE '%{pattern}%' ESCAPE '\\'"
+            )
+            try:
+                result_layer = datasource.ExecuteSQL(sql, dialect='OGRSQL')
+            except RuntimeError as e:
+                self.logger.debug(f"Requête impossible sur la table de domaine {table_name}: {e}")
+                continue
+            if result_layer is None:
+                continue
+            
+            try:
+                domain_values.update(self._read_code_descriptions(result_layer))
+            finally:
+                datasource.ReleaseResultSet(result_layer)
+        
         return domain_values
     
+    def _read_code_descriptions(self, result_layer) -> Dict[int, str]:
+        """
+        Lit les paires (code, description) d'un résultat SQL à deux colonnes.
+        
+        Utilise l'API Arrow de GDAL (colonnes entières par lot, GDAL >= 3.6
+        et pyarrow) si disponible, sinon un parcours entité par entité.
+        
+        Args:
+            result_layer: Couche résultat de ExecuteSQL (code, description)
+            
+        Returns:
+            Dictionnaire {code: description}
+        """
+        if pa is not None and hasattr(result_layer, 'GetArrowStreamAsPyArrow'):
+            values = {}
+            try:
+                stream = result_layer.GetArrowStreamAsPyArrow(['INCLUDE_FID=NO'])
+                for batch in stream:
+                    if batch.num_columns != 2 or not pa.types.is_integer(batch.schema.field(0).type):
+                        raise TypeError("colonnes inattendues dans le flux Arrow")
+                    for code, desc in zip(batch.column(0).to_pylist(), batch.column(1).to_pylist()):
+                        if code is not None and desc:
+                            values[code] = str(desc)
+                return values
+            except (RuntimeError, TypeError, ValueError) as e:
+                self.logger.debug(f"Lecture Arrow impossible, parcours entité par entité: {e}")
+            finally:
+                stream = None  # Libérer le flux avant tout parcours classique
+            result_layer.ResetReading()
+        
+        values = {}
+        for feature in result_layer:
+            desc = feature.GetFieldAsString(1)
+            if desc:
+                values[feature.GetFieldAsInteger(0)] = desc
+        return values
+    
+    def _get_domain_table_columns(self, domain_layer) -> Optional[Tuple[str, str, str]]:
+        """
+        Identifie (une fois par table) les colonnes nom de domaine, code et description.
+        
+        Args:
+            domain_layer: Couche OGR de la table de domaine
+            
+        Returns:
+            Tuple (colonne_domaine, colonne_code, colonne_description) ou None
+            si la table ne contient pas ces trois colonnes
+        """
+        table_name = domain_layer.GetName()
+        if table_name in self._domain_table_columns:
+            return self._domain_table_columns[table_name]
+        
+        # Rôle -> colonne (la dernière colonne correspondante l'emporte)
+        roles = {}
+        feature_def = domain_layer.GetLayerDefn()
+        for j in range(feature_def.GetFieldCount()):
+            name = feature_def.GetFieldDefn(j).GetName()
+            field_name = name.lower()
+            for term, term_roles in _DOMAIN_COLUMN_ROLES.items():
+                if term in field_name:
+                    for role in term_roles:
+                        roles[role] = name
+        
+        columns = tuple(roles.get(role) for role in ('domain', 'code', 'desc'))
+        if not all(columns):
+            columns = None
+        self._domain_table_columns[table_name] = columns
+        return columns
+    
     def _extract_from_layer_metadata(self, layer, field_name: str, domain_name: Optional[str]) -> Dict[int, str]:
         """Extrait les valeurs de domaine depuis les métadonnées de la couche."""
         domain_values = {}
         try:
             metadata = layer.GetMetadata()
-            if metadata:
-                # Chercher des clés contenant le nom du champ ou domaine
-                search_terms = [field_name]
-                if domain_name:
-                    search_terms.append(domain_name)
-                
-                for key, value in metadata.items():
-                    key_upper = key.upper()
-                    if any(term.upper() in key_upper for term in search_terms):
-                        if 'CODE' in key_upper or 'DOMAIN' in key_upper or 'VALUE' in key_upper:
-                            # Parser les valeurs
-                            domain_values.update(self._parse_domain_string(value))
-        except:
-            pass
+        except RuntimeError as e:
+            self.logger.debug(f"Erreur lecture des métadonnées de couche pour {field_name}: {e}")
+            return domain_values
+        
+        if metadata:
+            # Chercher des clés contenant le nom du champ ou domaine
+            # (termes mis en majuscules une seule fois)
+            search_terms = [field_name.upper()]
+            if domain_name:
+                search_terms.append(domain_name.upper())
+            
+            for key, value in metadata.items():
+                key_upper = key.upper()
+                if _DOMAIN_METADATA_KEY_RE.search(key_upper) and any(term in key_upper for term in search_terms):
+                    # Parser les valeurs
+                    domain_values.update(self._parse_domain_string(value))
         return domain_values
     
     def _extract_from_datasource_metadata(self, datasource, layer_name: str, 
@@ -864,18 +1479,19 @@ class GDBMetadataExtractor:
         domain_values = {}
         try:
             ds_metadata = datasource.GetMetadata()
-            if ds_metadata:
-                search_terms = [layer_name, field_name]
-                if domain_name:
-                    search_terms.append(domain_name)
-                
-                for key, value in ds_metadata.items():
-                    key_upper = key.upper()
-                    if any(term.upper() in key_upper for term in search_terms):
-                        if 'CODE' in key_upper or 'DOMAIN' in key_upper or 'VALUE' in key_upper:
-                            domain_values.update(self._parse_domain_string(value))
-        except:
-            pass
+        except RuntimeError as e:
+            self.logger.debug(f"Erreur lecture des métadonnées du datasource pour {field_name}: {e}")
+            return domain_values
+        
+        if ds_metadata:
+            search_terms = [layer_name.upper(), field_name.upper()]
+            if domain_name:
+                search_terms.append(domain_name.upper())
+            
+            for key, value in ds_metadata.items():
+                key_upper = key.upper()
+                if _DOMAIN_METADATA_KEY_RE.search(key_upper) and any(term in key_upper for term in search_terms):
+                    domain_values.update(self._parse_domain_string(value))
         return domain_values
     
     def _extract_from_field_metadata(self, field_def) -> Dict[int, str]:
@@ -883,12 +1499,14 @@ class GDBMetadataExtractor:
         domain_values = {}
         try:
             field_metadata = field_def.GetMetadata()
-            if field_metadata:
-                for key, value in field_metadata.items():
-                    if 'DOMAIN' in key.upper() or 'CODE' in key.upper() or 'VALUE' in key.upper():
-                        domain_values.update(self._parse_domain_string(value))
-        except:
-            pass
+        except (RuntimeError, AttributeError) as e:
+            self.logger.debug(f"Erreur lecture des métadonnées du champ: {e}")
+            return domain_values
+        
+        if field_metadata:
+            for key, value in field_metadata.items():
+                if _DOMAIN_METADATA_KEY_RE.search(key.upper()):
+                    domain_values.update(self._parse_domain_string(value))
         return domain_values
     
     def _parse_domain_string(self, value: str) -> Dict[int, str]:
@@ -906,59 +1524,36 @@ class GDBMetadataExtractor:
         Returns:
             Dictionnaire {code: description}
         """
-        domain_values = {}
         if not value:
-            return domain_values
+            return {}
         
-        try:
-            # Format 1: "CODE1:Description1;CODE2:Description2"
-            if ':' in value and ';' in value:
-                parts = value.split(';')
-                for part in parts:
-                    if ':' in part:
-                        code_str, desc = part.split(':', 1)
-                        try:
-                            code = int(code_str.strip())
-                            domain_values[code] = desc.strip()
-                        except ValueError:
-                            pass
-            
-            # Format 2: "1=Description1,2=Description2"
-            elif '=' in value and ',' in value:
-                parts = value.split(',')
-                for part in parts:
-                    if '=' in part:
-                        code_str, desc = part.split('=', 1)
-                        try:
-                            code = int(code_str.strip())
-                            domain_values[code] = desc.strip()
-                        except ValueError:
-                            pass
-            
-            # Format 3: Simple "CODE:Description"
-            elif ':' in value:
-                code_str, desc = value.split(':', 1)
-                try:
-                    code = int(code_str.strip())
-                    domain_values[code] = desc.strip()
-                except ValueError:
-                    pass
-        except:
-            pass
+        # Une seule passe regex : ';' sépare les paires si présent (ou pour une
+        # paire unique "CODE:Description"), sinon ',' pour "1=Description1,2=Description2"
+        if ';' in value or '=' not in value:
+            pattern = _DOMAIN_PAIR_SEMICOLON_RE
+        else:
+            pattern = _DOMAIN_PAIR_COMMA_RE
         
-        return domain_values
+        return {int(code): desc.strip() for code, desc in pattern.findall(value)}
     
-    def _extract_unique_values_from_data(self, layer, field_name: str, field_def) -> Dict[int, str]:
+    def _extract_unique_values_from_data(self, layer, field_name: str, field_def,
+                                         max_rows: int = 10000,
+                                         max_distinct: int = 256) -> Dict[int, str]:
         """
         Extrait les valeurs uniques depuis les données réelles.
         
         Note: Cette méthode ne peut pas obtenir les descriptions des valeurs,
-        mais peut identifier les codes uniques utilisés.
+        mais peut identifier les codes uniques utilisés. Les valeurs distinctes
+        sont calculées par GDAL (SELECT DISTINCT) ; à défaut, un parcours borné
+        (max_rows entités, max_distinct valeurs) ne décode que le champ demandé.
         
         Args:
             layer: Layer OGR
             field_name: Nom du champ
             field_def: FieldDefn OGR
+            max_rows: Nombre maximal d'entités parcourues (parcours de repli)
+            max_distinct: Nombre maximal de valeurs distinctes retenues
+                (les domaines ArcGIS ont rarement plus de 256 codes)
             
         Returns:
             Dictionnaire {code: ''} (descriptions vides car non accessibles)
@@ -969,22 +1564,15 @@ class GDBMetadataExtractor:
             if field_idx < 0:
                 return domain_values
             
-            # Extraire les valeurs uniques (limité à 1000 pour performance)
-            values = set()
-            layer.ResetReading()
-            count = 0
-            for feature in layer:
-                if count >= 10000:  # Limiter pour éviter les problèmes de performance
-                    break
-                value = feature.GetFieldAsString(field_idx)
-                if value and value.strip():
-                    values.add(value.strip())
-                count += 1
+            # Valeurs distinctes calculées côté GDAL (pas d'entité Python par ligne)
+            values = self._query_distinct_values(layer, field_name, max_distinct)
+            if values is None:
+                values = self._scan_distinct_values(layer, field_idx, max_rows, max_distinct)
             
             # Convertir en dictionnaire
             # Pour les valeurs numériques, utiliser directement comme code
             # Pour les valeurs textuelles, utiliser la valeur comme description avec un code dérivé
-            for value in sorted(values):
+            for value in values:
                 try:
                     # Essayer de convertir en int pour les codes numériques
                     code = int(value)
@@ -996,8 +1584,8 @@ class GDBMetadataExtractor:
                         code = ord(value)  # Utiliser le code ASCII comme code
                         domain_values[code] = value  # La valeur elle-même comme description
                     else:
-                        # Pour les valeurs multiples, utiliser un hash
-                        code = abs(hash(value)) % 1000000
+                        # Pour les valeurs multiples, utiliser un hash déterministe
+                        code = self._stable_code(value)
                         domain_values[code] = value  # Utiliser la valeur comme description
             
             if domain_values:
@@ -1010,6 +1598,91 @@ class GDBMetadataExtractor:
         
         return domain_values
     
+    def _query_distinct_values(self, layer, field_name: str, limit: int) -> Optional[set]:
+        """
+        Récupère les valeurs distinctes d'un champ via une requête OGR SQL.
+        
+        Args:
+            layer: Layer OGR
+            field_name: Nom du champ
+            limit: Nombre maximal de valeurs distinctes
+            
+        Returns:
+            Ensemble des valeurs (chaînes non vides) ou None si la requête échoue
+        """
+        datasource = self.get_datasource()
+        if datasource is None:
+            return None
+        
+        field_sql = _quote_identifier(field_name)
+        layer_sql = _quote_identifier(layer.GetName())
+        sql = (
+            f"SELECT DISTINCT {field_sql} FROM {layer_sql} "
+            f"WHERE {field_sql} IS NOT NULL LIMIT {limit}"
+        )
+        
+        try:
+            result_layer = datasource.ExecuteSQL(sql, dialect='OGRSQL')
+        except RuntimeError as e:
+            self.logger.debug(f"Requête DISTINCT impossible pour {field_name}: {e}")
+            return None
+        if result_layer is None:
+            return None
+        
+        values = set()
+        try:
+            for feature in result_layer:
+                value = feature.GetFieldAsString(0).strip()
+                if value:
+                    values.add(value)
+        finally:
+            datasource.ReleaseResultSet(result_layer)
+        
+        return values
+    
+    def _scan_distinct_values(self, layer, field_idx: int, max_rows: int, max_distinct: int) -> set:
+        """
+        Récupère les valeurs distinctes d'un champ par un parcours borné de la couche.
+        
+        Args:
+            layer: Layer OGR
+            field_idx: Index du champ
+            max_rows: Nombre maximal d'entités parcourues
+            max_distinct: Arrêt anticipé dès ce nombre de valeurs distinctes
+            
+        Returns:
+            Ensemble des valeurs (chaînes non vides)
+        """
+        # Ne décoder que le champ demandé (ni les autres champs, ni la géométrie)
+        layer_def = layer.GetLayerDefn()
+        ignored_fields = [
+            layer_def.GetFieldDefn(i).GetName()
+            for i in range(layer_def.GetFieldCount()) if i != field_idx
+        ]
+        ignored_fields.extend(['OGR_GEOMETRY', 'OGR_STYLE'])
+        
+        values = set()
+        layer.SetIgnoredFields(ignored_fields)
+        try:
+            # Ne pas lire les entités dont le champ est NULL
+            field_name = layer_def.GetFieldDefn(field_idx).GetName()
+            layer.SetAttributeFilter(f"{_quote_identifier(field_name)} IS NOT NULL")
+            for _ in range(max_rows):
+                feature = layer.GetNextFeature()
+                if feature is None:
+                    break
+                value = feature.GetFieldAsString(field_idx)
+                if value and value.strip():
+                    values.add(value.strip())
+                    if len(values) >= max_distinct:
+                        break
+        finally:
+            layer.SetAttributeFilter(None)
+            layer.SetIgnoredFields([])
+            layer.ResetReading()
+        
+        return values
+    
     def extract_primary_keys(self, layer_name: str) -> List[str]:
         """
         Extrait les clés primaires pour une couche.
@@ -1022,11 +1695,7 @@ class GDBMetadataExtractor:
         """
         primary_keys = []
         try:
-            datasource = self._get_datasource()
-            if datasource is None:
-                return primary_keys
-            
-            layer = datasource.GetLayerByName(layer_name)
+            layer = self.get_layer(layer_name)
             if layer is None:
                 return primary_keys
             
@@ -1039,20 +1708,23 @@ class GDBMetadataExtractor:
             # Méthode 2 : Chercher dans les métadonnées
             try:
                 metadata = layer.GetMetadata()
-                if metadata:
-                    # Chercher les clés primaires dans les métadonnées
-                    for key in metadata.keys():
-                        if "PRIMARY_KEY" in key.upper() or "PK_" in key.upper():
-                            # Extraire les noms de champs
-                            value = metadata[key]
-                            if value:
-                                # Format peut varier, essayer de parser
-                                fields = [f.strip() for f in value.split(',')]
-                                for field in fields:
-                                    if field and field not in primary_keys:
-                                        primary_keys.append(field)
-            except:
-                pass
+            except RuntimeError as e:
+                self.logger.debug(f"  Métadonnées de couche illisibles pour {layer_name}: {e}")
+                metadata = None
+            
+            if metadata:
+                # Chercher les clés primaires dans les métadonnées
+                # (chaque clé n'est mise en majuscules qu'une fois)
+                for key, value in metadata.items():
+                    key_upper = key.upper()
+                    if "PRIMARY_KEY" in key_upper or "PK_" in key_upper:
+                        # Extraire les noms de champs
+                        if value:
+                            # Format peut varier, essayer de parser
+                            fields = [f.strip() for f in value.split(',')]
+                            for field in fields:
+                                if field and field not in primary_keys:
+                                    primary_keys.append(field)
             
             # Ne pas fermer la datasource (réutilisation)
         except Exception as e:
@@ -1084,22 +1756,84 @@ class GDBMetadataExtractor:
         
         return triggers
     
-    def extract_all_metadata(self, layer_name: str) -> Dict:
+    def extract_all_metadata(self, layer_name: str,
+                             kinds: Optional[Tuple[str, ...]] = None) -> Dict:
         """
         Extrait toutes les métadonnées pour une couche.
         
+        Le résultat est mis en cache par couche : les appels suivants ne
+        relisent pas la géodatabase (voir invalidate()). Seuls les types
+        demandés sont extraits : la couche n'est pas parcourue pour des
+        métadonnées qui ne seront pas appliquées.
+        
         Args:
             layer_name: Nom de la couche
+            kinds: Types de métadonnées à extraire (clés de METADATA_EXTRACTORS,
+                   None pour tous)
             
         Returns:
-            Dictionnaire avec toutes les métadonnées
+            Dictionnaire avec les métadonnées extraites (partagé avec le cache :
+            à traiter en lecture seule)
         """
-        return {
-            'field_aliases': self.extract_field_aliases(layer_name),
-            'domain_values': self.extract_domain_values(layer_name),
-            'primary_keys': self.extract_primary_keys(layer_name),
-            'triggers': self.extract_triggers(layer_name)
-        }
+        metadata = self._metadata_cache.setdefault(layer_name, {})
+        for kind in (self.METADATA_EXTRACTORS if kinds is None else kinds):
+            if kind not in metadata:
+                metadata[kind] = getattr(self, self.METADATA_EXTRACTORS[kind])(layer_name)
+        return metadata
+    
+    def extract_all_metadata_bulk(self, layer_names: List[str],
+                                  kinds: Optional[Tuple[str, ...]] = None) -> Dict[str, Dict]:
+        """
+        Extrait en parallèle toutes les métadonnées de plusieurs couches.
+        
+        Chaque thread utilise sa propre datasource (voir get_datasource()) ;
+        les résultats alimentent le cache de extract_all_metadata().
+        
+        Args:
+            layer_names: Noms des couches
+            kinds: Types de métadonnées à extraire (None pour tous)
+            
+        Returns:
+            Dictionnaire {nom_couche: métadonnées} (lecture seule)
+        """
+        wanted = tuple(self.METADATA_EXTRACTORS if kinds is None else kinds)
+        pending = [
+            name for name in layer_names
+            if not all(kind in self._metadata_cache.get(name, ()) for kind in wanted)
+        ]
+        if pending:
+            # Peupler le cache des domaines avant de lancer les workers
+            # (inutile si les domaines ne sont pas demandés)
+            if 'domain_values' in wanted:
+                self._load_domains_from_catalog()
+            
+            max_workers = min(8, os.cpu_count() or 1, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.extract_all_metadata, name, wanted): name
+                    for name in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.debug(
+                            f"Erreur lors de l'extraction des métadonnées pour {futures[future]}: {e}"
+                        )
+        
+        return {name: self._metadata_cache.get(name, {}) for name in layer_names}
+    
+    def invalidate(self, layer_name: Optional[str] = None):
+        """
+        Vide le cache des métadonnées extraites.
+        
+        Args:
+            layer_name: Couche à invalider (None pour toutes les couches)
+        """
+        if layer_name is None:
+            self._metadata_cache.clear()
+        else:
+            self._metadata_cache.pop(layer_name, None)
 
 
 class SpatialiteMetadataApplier:
@@ -1119,6 +1853,99 @@ class SpatialiteMetadataApplier:
         """
         self.output_path = output_path
         self.logger = logger
+        self.fast_mode = False  # Optimisations agressives (fixé par convert())
+        self._connection = None  # Connexion partagée, ouverte au premier usage
+        self._domain_hashes = set()  # Domaines déjà écrits (empreinte du contenu)
+        self._legacy_domain_table = None  # metadata_domain_values est une table (ancienne base)
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Retourne la connexion SQLite partagée (ouverte et configurée au premier appel).
+        
+        Returns:
+            Connexion vers le fichier Spatialite
+        """
+        if self._connection is None:
+            # Mode autocommit (transactions explicites BEGIN/COMMIT) et cache de
+            # requêtes préparées élargi : les requêtes d'insertion sont constantes
+            conn = sqlite3.connect(str(self.output_path), cached_statements=256, isolation_level=None)
+            conn.execute("PRAGMA synchronous=OFF" if self.fast_mode else "PRAGMA synchronous=NORMAL")
+            if self.fast_mode:
+                conn.execute("PRAGMA journal_mode=MEMORY")  # Journal en mémoire seulement
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")  # 64MB
+            conn.execute("PRAGMA mmap_size=268435456")  # Lecture par mmap (256MB)
+            
+            # Charger l'extension spatialite si disponible (une seule fois)
+            try:
+                conn.enable_load_extension(True)
+                conn.execute("SELECT load_extension('mod_spatialite')")
+            except (AttributeError, sqlite3.Error):
+                pass  # Si mod_spatialite n'est pas disponible, continuer
+            
+            self._connection = conn
+        return self._connection
+    
+    def close(self):
+        """Ferme la connexion partagée (rouverte automatiquement si nécessaire)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._domain_hashes.clear()
+        self._legacy_domain_table = None
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Regroupe toutes les écritures de métadonnées dans une seule transaction.
+        
+        Les méthodes apply_* appelées dans ce bloc n'ouvrent qu'un point de
+        sauvegarde (SAVEPOINT) : un seul COMMIT, donc une seule synchronisation
+        disque, pour l'ensemble des couches.
+        
+        Yields:
+            Connexion SQLite partagée
+        """
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            self._domain_hashes.clear()  # Domaines écrits dans la transaction annulée
+            raise
+        conn.commit()
+    
+    @contextmanager
+    def _atomic(self):
+        """
+        Exécute un bloc de façon atomique : transaction propre, ou point de
+        sauvegarde si une transaction englobante est déjà ouverte.
+        
+        Yields:
+            Connexion SQLite partagée
+        """
+        conn = self.get_connection()
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except sqlite3.Error:
+                conn.rollback()
+                self._domain_hashes.clear()
+                raise
+            conn.commit()
+            return
+        
+        conn.execute("SAVEPOINT apply_metadata")
+        try:
+            yield conn
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO apply_metadata")
+            conn.execute("RELEASE apply_metadata")
+            self._domain_hashes.clear()
+            raise
+        conn.execute("RELEASE apply_metadata")
     
     def _execute_sql(self, sql: str) -> bool:
         """
@@ -1131,18 +1958,8 @@ class SpatialiteMetadataApplier:
             True si succès, False sinon
         """
         try:
-            conn = sqlite3.connect(str(self.output_path))
-            conn.enable_load_extension(True)
-            
-            # Charger l'extension spatialite si disponible
-            try:
-                conn.execute("SELECT load_extension('mod_spatialite')")
-            except:
-                pass  # Si mod_spatialite n'est pas disponible, continuer
-            
-            conn.execute(sql)
-            conn.commit()
-            conn.close()
+            with self._atomic() as conn:
+                conn.execute(sql)
             return True
         except Exception as e:
             self.logger.debug(f"Erreur SQL: {e}")
@@ -1169,24 +1986,23 @@ class SpatialiteMetadataApplier:
                 CREATE TABLE IF NOT EXISTS metadata_field_aliases (
                     table_name TEXT NOT NULL,
                     field_name TEXT NOT NULL,
-                    alias TEXT NOT NULL,
-                    PRIMARY KEY (table_name, field_name)
+                    alias TEXT NOT NULL
                 )
             """)
             
-            # Insérer les alias
-            conn = sqlite3.connect(str(self.output_path))
-            cursor = conn.cursor()
-            
-            for field_name, alias in aliases.items():
-                cursor.execute("""
+            # Insérer les alias en une seule transaction explicite ; l'index
+            # unique (clé table/champ) est construit après la première insertion
+            rows = [(table_name, field_name, alias) for field_name, alias in aliases.items()]
+            with self._atomic() as conn:
+                conn.executemany("""
                     INSERT OR REPLACE INTO metadata_field_aliases 
                     (table_name, field_name, alias) 
                     VALUES (?, ?, ?)
-                """, (table_name, field_name, alias))
-            
-            conn.commit()
-            conn.close()
+                """, rows)
+                conn.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_metadata_field_aliases 
+                    ON metadata_field_aliases (table_name, field_name)
+                """)
             
             self.logger.info(f"✓ {len(aliases)} alias de champs appliqués pour '{table_name}'")
             return True
@@ -1194,10 +2010,68 @@ class SpatialiteMetadataApplier:
             self.logger.warning(f"Erreur lors de l'application des alias pour {table_name}: {e}")
             return False
     
+    @staticmethod
+    def _domain_hash(values: Dict[int, str]) -> str:
+        """
+        Calcule l'empreinte du contenu d'un domaine codé.
+        
+        Args:
+            values: Dictionnaire {code: description}
+            
+        Returns:
+            Empreinte hexadécimale (identique pour deux domaines de même contenu)
+        """
+        payload = json.dumps(sorted(values.items()), ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _create_domain_tables(self):
+        """
+        Crée les tables des domaines codés si elles n'existent pas.
+        
+        Chaque domaine distinct n'est stocké qu'une fois (metadata_domain_codes,
+        clé : empreinte du contenu) ; metadata_domain_fields associe les champs
+        à leur domaine et la vue metadata_domain_values expose le format
+        historique (table_name, field_name, code, description).
+        """
+        if self._legacy_domain_table is None:
+            row = self.get_connection().execute(
+                "SELECT type FROM sqlite_master WHERE name = 'metadata_domain_values'"
+            ).fetchone()
+            self._legacy_domain_table = row is not None and row[0] == 'table'
+        if self._legacy_domain_table:
+            return  # Base créée par une version précédente : format conservé
+        
+        with self._atomic() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS metadata_domain_codes (
+                    domain_hash TEXT NOT NULL,
+                    code INTEGER NOT NULL,
+                    description TEXT NOT NULL,
+                    PRIMARY KEY (domain_hash, code)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS metadata_domain_fields (
+                    table_name TEXT NOT NULL,
+                    field_name TEXT NOT NULL,
+                    domain_hash TEXT NOT NULL,
+                    PRIMARY KEY (table_name, field_name)
+                )
+            """)
+            conn.execute("""
+                CREATE VIEW IF NOT EXISTS metadata_domain_values AS
+                SELECT f.table_name, f.field_name, c.code, c.description
+                FROM metadata_domain_fields f
+                JOIN metadata_domain_codes c ON c.domain_hash = f.domain_hash
+            """)
+    
     def apply_domain_values(self, table_name: str, domain_values: Dict[str, Dict[int, str]]) -> bool:
         """
         Applique les domaines codés via une table de correspondance.
         
+        Un domaine partagé par plusieurs champs ou couches (Oui/Non, codes
+        régionaux, ...) n'est écrit qu'une seule fois.
+        
         Args:
             table_name: Nom de la table
             domain_values: Dictionnaire {nom_champ: {code: description}}
@@ -1205,17 +2079,9 @@ class SpatialiteMetadataApplier:
         Returns:
             True si succès
         """
-        # Toujours créer la table même si vide, pour la cohérence
+        # Toujours créer les tables même si vides, pour la cohérence
         try:
-            self._execute_sql("""
-                CREATE TABLE IF NOT EXISTS metadata_domain_values (
-                    table_name TEXT NOT NULL,
-                    field_name TEXT NOT NULL,
-                    code INTEGER NOT NULL,
-                    description TEXT NOT NULL,
-                    PRIMARY KEY (table_name, field_name, code)
-                )
-            """)
+            self._create_domain_tables()
         except Exception as e:
             self.logger.debug(f"Erreur lors de la création de metadata_domain_values: {e}")
         
@@ -1223,23 +2089,36 @@ class SpatialiteMetadataApplier:
             return True
         
         try:
+            total_values = sum(len(values) for values in domain_values.values())
             
-            # Insérer les valeurs de domaine
-            conn = sqlite3.connect(str(self.output_path))
-            cursor = conn.cursor()
-            
-            total_values = 0
-            for field_name, values in domain_values.items():
-                for code, description in values.items():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO metadata_domain_values 
-                        (table_name, field_name, code, description) 
-                        VALUES (?, ?, ?, ?)
-                    """, (table_name, field_name, code, description))
-                    total_values += 1
-            
-            conn.commit()
-            conn.close()
+            if self._legacy_domain_table:
+                self._apply_legacy_domain_values(table_name, domain_values)
+            else:
+                # Associer chaque champ à l'empreinte de son domaine ; les
+                # valeurs ne sont insérées que pour les domaines encore inconnus
+                field_rows = []
+                code_rows = []
+                for field_name, values in domain_values.items():
+                    domain_hash = self._domain_hash(values)
+                    field_rows.append((table_name, field_name, domain_hash))
+                    if domain_hash not in self._domain_hashes:
+                        self._domain_hashes.add(domain_hash)
+                        code_rows.extend(
+                            (domain_hash, code, description)
+                            for code, description in values.items()
+                        )
+                
+                with self._atomic() as conn:
+                    conn.executemany("""
+                        INSERT OR IGNORE INTO metadata_domain_codes 
+                        (domain_hash, code, description) 
+                        VALUES (?, ?, ?)
+                    """, code_rows)
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO metadata_domain_fields 
+                        (table_name, field_name, domain_hash) 
+                        VALUES (?, ?, ?)
+                    """, field_rows)
             
             self.logger.info(
                 f"✓ {total_values} valeurs de domaine appliquées pour '{table_name}' "
@@ -1250,6 +2129,33 @@ class SpatialiteMetadataApplier:
             self.logger.warning(f"Erreur lors de l'application des domaines pour {table_name}: {e}")
             return False
     
+    def _apply_legacy_domain_values(self, table_name: str, domain_values: Dict[str, Dict[int, str]]):
+        """
+        Écrit les domaines dans une table metadata_domain_values existante
+        (une ligne par table, champ et code).
+        
+        Args:
+            table_name: Nom de la table
+            domain_values: Dictionnaire {nom_champ: {code: description}}
+        """
+        # Insérer les valeurs de domaine en une seule transaction explicite ;
+        # l'index unique (clé table/champ/code) est construit après la première insertion
+        rows = [
+            (table_name, field_name, code, description)
+            for field_name, values in domain_values.items()
+            for code, description in values.items()
+        ]
+        with self._atomic() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO metadata_domain_values 
+                (table_name, field_name, code, description) 
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_metadata_domain_values 
+                ON metadata_domain_values (table_name, field_name, code)
+            """)
+    
     def apply_primary_keys(self, table_name: str, primary_keys: List[str]) -> bool:
         """
         Applique les clés primaires.
@@ -1265,25 +2171,18 @@ class SpatialiteMetadataApplier:
             return True
         
         try:
-            # Vérifier si la clé primaire existe déjà
-            conn = sqlite3.connect(str(self.output_path))
-            cursor = conn.cursor()
-            
-            # Vérifier si la table existe
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name=?
-            """, (table_name,))
-            
-            if not cursor.fetchone():
-                conn.close()
+            # Vérifier si la table existe (connexion partagée)
+            cursor = self.get_connection().execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=? LIMIT 1",
+                (table_name,)
+            )
+            if cursor.fetchone() is None:
                 return False
             
             # Créer un index unique pour simuler la clé primaire
             # (si ce n'est pas déjà le champ ogc_fid qui est géré automatiquement)
             if len(primary_keys) == 1 and primary_keys[0] in ['ogc_fid', 'fid', 'OBJECTID']:
                 # La clé primaire est déjà gérée par Spatialite
-                conn.close()
                 self.logger.debug(f"Clé primaire {primary_keys[0]} déjà gérée pour '{table_name}'")
                 return True
             
@@ -1291,15 +2190,15 @@ class SpatialiteMetadataApplier:
             index_name = f"pk_{table_name}_{'_'.join(primary_keys)}"
             index_name = index_name.replace('-', '_').replace('.', '_')[:50]  # Limiter la longueur
             
-            # Construire la requête SQL
-            columns = ', '.join([f'"{col}"' for col in primary_keys])
+            # Construire la requête SQL (noms entre guillemets : l'index peut
+            # commencer par un chiffre ou contenir des espaces)
+            columns = ', '.join(_quote_identifier(col) for col in primary_keys)
             sql = f"""
-                CREATE UNIQUE INDEX IF NOT EXISTS {index_name} 
-                ON "{table_name}" ({columns})
+                CREATE UNIQUE INDEX IF NOT EXISTS {_quote_identifier(index_name)} 
+                ON {_quote_identifier(table_name)} ({columns})
             """
             
             success = self._execute_sql(sql)
-            conn.close()
             
             if success:
                 self.logger.info(f"✓ Clé primaire appliquée pour '{table_name}': {', '.join(primary_keys)}")
@@ -1322,10 +2221,19 @@ class SpatialiteMetadataApplier:
         if not triggers:
             return True
         
-        success_count = 0
-        for trigger_sql in triggers:
-            if self._execute_sql(trigger_sql):
-                success_count += 1
+        # Tous les triggers dans un seul point de sauvegarde ; executescript()
+        # n'est pas utilisable ici car il valide la transaction englobante
+        try:
+            with self._atomic() as conn:
+                for trigger_sql in triggers:
+                    conn.execute(trigger_sql)
+            success_count = len(triggers)
+        except sqlite3.Error:
+            # Un trigger invalide : rejouer un par un pour conserver les autres
+            success_count = 0
+            for trigger_sql in triggers:
+                if self._execute_sql(trigger_sql):
+                    success_count += 1
         
         if success_count > 0:
             self.logger.info(f"✓ {success_count} trigger(s) appliqué(s) pour '{table_name}'")
@@ -1348,7 +2256,34 @@ class SpatialiteMetadataApplier:
         success &= self.apply_domain_values(table_name, metadata.get('domain_values', {}))
         success &= self.apply_primary_keys(table_name, metadata.get('primary_keys', []))
         success &= self.apply_triggers(table_name, metadata.get('triggers', []))
+        if success:
+            # Marqueur consulté par --resume pour repérer les tables non finalisées
+            try:
+                with self._atomic() as conn:
+                    conn.execute("CREATE TABLE IF NOT EXISTS metadata_layers (table_name TEXT PRIMARY KEY)")
+                    conn.execute("INSERT OR REPLACE INTO metadata_layers (table_name) VALUES (?)", (table_name,))
+            except sqlite3.Error as e:
+                self.logger.debug(f"Marqueur de métadonnées non enregistré pour {table_name}: {e}")
+                success = False
         return success
+    
+    def has_metadata(self, table_name: str) -> bool:
+        """
+        Indique si les métadonnées d'une table ont été appliquées.
+        
+        Args:
+            table_name: Nom de la table
+            
+        Returns:
+            True si la table figure dans metadata_layers
+        """
+        try:
+            row = self.get_connection().execute(
+                "SELECT 1 FROM metadata_layers WHERE table_name = ?", (table_name,)
+            ).fetchone()
+        except sqlite3.Error:
+            return False  # Table de marqueurs absente
+        return row is not None
 
 
 class ProgressLogger:
@@ -1380,7 +2315,6 @@ class ProgressLogger:
         console_handler.setFormatter(formatter)
         self.logger.addHandler(console_handler)
         
-        self.progress_lock = Lock()
         self.start_time = None
     
     def info(self, message: str):
@@ -1422,6 +2356,143 @@ class ProgressLogger:
             return f"{secs}s"
 
 
+def _run_ogr2ogr(cmd: list, layer_name: str, logger: 'ProgressLogger',
+                 show_progress: bool) -> Tuple[str, bool, str]:
+    """
+    Exécute une commande ogr2ogr en suivant sa sortie.
+    
+    Args:
+        cmd: Commande ogr2ogr complète
+        layer_name: Nom de la couche convertie (pour les logs)
+        logger: Logger pour les messages
+        show_progress: Si True, ogr2ogr affiche sa progression (-progress)
+        
+    Returns:
+        Tuple (layer_name, success, error_message)
+    """
+    try:
+        # Lancer la conversion avec capture de la progression (mode binaire :
+        # aucun décodage ni conversion de fins de ligne pour chaque octet lu).
+        # Sans -progress, la sortie standard est ignorée : seuls les messages
+        # d'erreur (stderr) sont lus
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE if show_progress else subprocess.DEVNULL,
+            stderr=subprocess.STDOUT if show_progress else subprocess.PIPE,
+            bufsize=io.DEFAULT_BUFFER_SIZE
+        )
+        
+        # Utiliser ProcessMonitor pour gérer le monitoring (lecture d'un
+        # bloc en fin de processus si ogr2ogr n'affiche pas sa progression)
+        monitor = ProcessMonitor(process, logger, layer_name)
+        if show_progress:
+            monitor.start_monitoring()
+            output_lines, return_code = monitor.wait_for_completion()
+        else:
+            output_lines, return_code = monitor.communicate()
+        
+        return _ogr2ogr_result(layer_name, output_lines, return_code, logger)
+            
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"✗ Exception lors de la conversion de '{layer_name}': {error_msg}")
+        return (layer_name, False, error_msg)
+
+
+def _ogr2ogr_result(layer_name: str, output_lines: list, return_code: int,
+                    logger: 'ProgressLogger') -> Tuple[str, bool, str]:
+    """
+    Journalise et traduit le résultat d'une exécution d'ogr2ogr.
+    
+    Args:
+        layer_name: Nom de la couche convertie
+        output_lines: Dernières lignes de sortie (octets non décodés)
+        return_code: Code de retour du processus
+        logger: Logger pour les messages
+        
+    Returns:
+        Tuple (layer_name, success, error_message)
+    """
+    if return_code == 0:
+        logger.info(f"✓ Couche '{layer_name}' convertie avec succès")
+        return (layer_name, True, "")
+    
+    # Le monitor ne conserve que les 10 dernières lignes
+    error_msg = "\n".join(
+        line.decode('utf-8', errors='replace') for line in output_lines
+    )
+    logger.error(f"✗ Erreur lors de la conversion de '{layer_name}': {error_msg}")
+    return (layer_name, False, error_msg)
+
+
+def _run_coroutine(coro):
+    """
+    Exécute une coroutine jusqu'à son terme depuis du code synchrone.
+    
+    asyncio.run() refuse de démarrer dans un thread dont la boucle tourne
+    déjà (Jupyter, application asyncio) : la coroutine tourne alors dans
+    sa propre boucle, sur un thread dédié.
+    
+    Args:
+        coro: Coroutine à exécuter
+        
+    Returns:
+        Résultat de la coroutine
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _run_ogr2ogr_async(cmd: list, layer_name: str, logger: 'ProgressLogger',
+                             show_progress: bool) -> Tuple[str, bool, str]:
+    """
+    Exécute une commande ogr2ogr depuis la boucle asyncio (conversion parallèle).
+    
+    Args:
+        cmd: Commande ogr2ogr complète
+        layer_name: Nom de la couche convertie (pour les logs)
+        logger: Logger pour les messages
+        show_progress: Si True, ogr2ogr affiche sa progression (-progress)
+        
+    Returns:
+        Tuple (layer_name, success, error_message)
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=subprocess.PIPE if show_progress else subprocess.DEVNULL,
+            stderr=subprocess.STDOUT if show_progress else subprocess.PIPE
+        )
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"✗ Exception lors de la conversion de '{layer_name}': {error_msg}")
+        return (layer_name, False, error_msg)
+    
+    # Lecture par blocs (les lignes de -progress peuvent être très longues),
+    # journalisée par le même traitement que ProcessMonitor
+    monitor = ProcessMonitor(process, logger, layer_name)
+    stream = process.stdout if show_progress else process.stderr
+    try:
+        while True:
+            chunk = await stream.read(65536)
+            monitor.feed(chunk)
+            if not chunk:
+                break
+        return_code = await process.wait()
+    except asyncio.CancelledError:
+        # Interruption : ne pas laisser ogr2ogr écrire dans une base abandonnée
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+    
+    return _ogr2ogr_result(layer_name, list(monitor.output_lines), return_code, logger)
+
+
 class GDBToSpatialiteConverter:
     """
     Convertisseur de géodatabase ESRI vers Spatialite.
@@ -1439,6 +2510,7 @@ class GDBToSpatialiteConverter:
             output_path: Chemin vers le fichier Spatialite de sortie
             logger: Instance de logger (optionnel)
         """
+        _ensure_gdal()
         self.gdb_path = Path(gdb_path)
         self.output_path = Path(output_path)
         self.logger = logger or ProgressLogger()
@@ -1447,6 +2519,23 @@ class GDBToSpatialiteConverter:
         # Initialiser les extracteurs/applicateurs de métadonnées
         self.metadata_extractor = GDBMetadataExtractor(self.gdb_path, self.logger)
         self.metadata_applier = SpatialiteMetadataApplier(self.output_path, self.logger)
+        
+        # Couches converties avec succès (index spatiaux créés après chargement)
+        self._converted_layers: List[str] = []
+        # Couches déjà présentes lors d'une reprise (finalisées avec les couches converties)
+        self._resumed_layers: List[str] = []
+        # Tables interrompues à supprimer avant de les reconvertir (reprise)
+        self._incomplete_tables: List[str] = []
+        self._table_name_cache: Optional[Dict[str, str]] = None  # casefold -> nom réel
+        self._output_created = False  # Fichier de sortie créé par cette conversion
+        self._feature_counts: Dict[str, int] = {}  # Nombre d'entités par couche (-1 si inconnu)
+        self._srs_cache: Dict[str, object] = {}  # Système de coordonnées par couche
+        self._layer_info_cache: Dict[str, Mapping] = {}  # Résultats de _get_layer_info()
+        
+        # Version (majeure, mineure) de GDAL utilisée par ogr2ogr, si connue
+        self._ogr2ogr_gdal_version: Optional[Tuple[int, int]] = None
+        self._cache_mb: Optional[int] = None  # Cache SQLite de chargement (fixé par convert())
+        self.output_format = 'sqlite'  # Format de sortie (fixé par convert())
     
     def _validate_inputs(self) -> None:
         """
@@ -1484,7 +2573,8 @@ class GDBToSpatialiteConverter:
         if driver is None:
             raise RuntimeError("Le driver OpenFileGDB n'est pas disponible. Vérifiez l'installation de GDAL.")
         
-        datasource = driver.Open(str(self.gdb_path), 0)
+        # Datasource partagée avec l'extracteur de métadonnées (ouverte une seule fois)
+        datasource = self.metadata_extractor.get_datasource()
         if datasource is None:
             raise RuntimeError(f"Impossible d'ouvrir la géodatabase: {self.gdb_path}")
         
@@ -1495,42 +2585,91 @@ class GDBToSpatialiteConverter:
         for i in range(layer_count):
             layer = datasource.GetLayerByIndex(i)
             layer_name = layer.GetName()
-            feature_count = layer.GetFeatureCount()
             layers.append(layer_name)
-            self.logger.debug(f"  Couche {i+1}: {layer_name} ({feature_count} entités)")
+            
+            # Nombre d'entités seulement s'il est connu sans parcourir la couche
+            # (force=0 renvoie -1 sinon), conservé pour le récapitulatif
+            feature_count = layer.GetFeatureCount(force=0)
+            self._feature_counts[layer_name] = feature_count
+            if self.logger.verbose:
+                if feature_count >= 0:
+                    self.logger.debug(f"  Couche {i+1}: {layer_name} ({feature_count} entités)")
+                else:
+                    self.logger.debug(f"  Couche {i+1}: {layer_name}")
         
-        datasource = None
         return layers
     
-    def _get_layer_info(self, layer_name: str) -> dict:
+    def _open_single_layer(self, layer_name: str) -> bool:
+        """
+        Vérifie l'existence d'une couche sans énumérer toutes les couches.
+        
+        Args:
+            layer_name: Nom de la couche demandée
+            
+        Returns:
+            True si la couche existe dans la géodatabase
+        """
+        self.logger.info(f"Ouverture de la géodatabase: {self.gdb_path}")
+        if self.metadata_extractor.get_datasource() is None:
+            raise RuntimeError(f"Impossible d'ouvrir la géodatabase: {self.gdb_path}")
+        
+        layer = self.metadata_extractor.get_layer(layer_name)
+        if layer is None:
+            self.logger.error(f"Couche introuvable dans la géodatabase: {layer_name}")
+            return False
+        
+        # Nombre d'entités seulement s'il est connu sans parcourir la couche
+        self._feature_counts[layer_name] = layer.GetFeatureCount(force=0)
+        return True
+    
+    def _get_layer_srs(self, layer_name: str, layer):
         """
-        Récupère les informations sur une couche.
+        Retourne le système de coordonnées d'une couche (lu une seule fois).
         
         Args:
             layer_name: Nom de la couche
+            layer: Couche OGR source
             
         Returns:
-            Dictionnaire avec les informations de la couche
+            SpatialReference OGR ou None si la couche n'en a pas
         """
-        driver = ogr.GetDriverByName("OpenFileGDB")
-        datasource = driver.Open(str(self.gdb_path), 0)
-        if datasource is None:
-            return {}
+        if layer_name not in self._srs_cache:
+            self._srs_cache[layer_name] = layer.GetSpatialRef()
+        return self._srs_cache[layer_name]
+    
+    def _get_layer_info(self, layer_name: str) -> Mapping:
+        """
+        Récupère les informations sur une couche (lues une seule fois).
         
-        layer = datasource.GetLayerByName(layer_name)
+        Args:
+            layer_name: Nom de la couche
+            
+        Returns:
+            Dictionnaire en lecture seule avec les informations de la couche
+            (feature_count vaut -1 si le nombre d'entités n'est pas connu sans
+            parcourir la couche)
+        """
+        info = self._layer_info_cache.get(layer_name)
+        if info is not None:
+            return info
+        
+        layer = self.metadata_extractor.get_layer(layer_name)
         if layer is None:
-            datasource = None
             return {}
         
-        info = {
+        feature_count = self._feature_counts.get(layer_name)
+        if feature_count is None:
+            feature_count = layer.GetFeatureCount(force=0)
+        
+        # Partagé avec le cache : exposé en lecture seule
+        info = MappingProxyType({
             'name': layer_name,
-            'feature_count': layer.GetFeatureCount(),
+            'feature_count': feature_count,
             'geom_type': layer.GetGeomType(),
-            'srs': layer.GetSpatialRef(),
+            'srs': self._get_layer_srs(layer_name, layer),
             'field_count': layer.GetLayerDefn().GetFieldCount()
-        }
-        
-        datasource = None
+        })
+        self._layer_info_cache[layer_name] = info
         return info
     
     @contextmanager
@@ -1577,16 +2716,71 @@ class GDBToSpatialiteConverter:
             for layer, error in failed_layers:
                 self.logger.warning(f"  - {layer}: {error[:100]}")
         
-        if success_count > 0:
-            file_size = output_path.stat().st_size / (1024 * 1024)  # MB
+        # Un seul appel système pour le type et la taille de la sortie
+        try:
+            output_stat = os.stat(output_path)
+        except FileNotFoundError:
+            output_stat = None
+        is_dir = output_stat is not None and stat.S_ISDIR(output_stat.st_mode)
+        
+        if success_count > 0 and output_stat is not None:
+            if is_dir:
+                # Export Parquet : taille totale des fichiers du dossier
+                total = sum(entry.stat().st_size for entry in os.scandir(output_path) if entry.is_file())
+            else:
+                total = output_stat.st_size
+            file_size = total / (1024 * 1024)  # MB
             self.logger.info(f"✓ Fichier créé: {output_path} ({file_size:.2f} MB)")
-        else:
+        elif success_count == 0:
             self.logger.error("✗ Aucune couche n'a été convertie")
-            if output_path.exists():
+            # Ne supprimer que le fichier créé par cette conversion : une base
+            # existante (--resume) garde les couches déjà converties
+            if self._output_created and is_dir:
+                shutil.rmtree(output_path, ignore_errors=True)
+            elif self._output_created and output_stat is not None:
                 output_path.unlink()
     
+    def _show_ogr2ogr_progress(self) -> bool:
+        """
+        Indique si ogr2ogr doit afficher sa propre progression (-progress).
+        
+        Inutile quand la barre tqdm suit déjà l'avancement par couche, sauf
+        en mode verbeux où la sortie détaillée est journalisée.
+        
+        Returns:
+            True si -progress doit être passé à ogr2ogr
+        """
+        return self.logger.verbose or tqdm is None
+    
+    def _sqlite_cache_mb(self, fast_mode: bool) -> int:
+        """
+        Retourne la taille du cache SQLite pendant le chargement (Mo).
+        
+        Args:
+            fast_mode: Si True, valeur par défaut plus élevée
+            
+        Returns:
+            Valeur de --cache-mb, sinon ajustée à la mémoire disponible
+        """
+        if self._cache_mb:
+            return self._cache_mb
+        return _SQLITE_CACHE_MB_FAST if fast_mode else _SQLITE_CACHE_MB
+    
+    def _sqlite_load_pragmas(self, fast_mode: bool) -> str:
+        """
+        Construit la valeur d'OGR_SQLITE_PRAGMA pour le chargement des données.
+        
+        Args:
+            fast_mode: Si True, PRAGMA sans journal ni synchronisation
+            
+        Returns:
+            Liste de PRAGMA séparés par des virgules
+        """
+        pragmas = _OGR2OGR_SQLITE_PRAGMA_FAST if fast_mode else _OGR2OGR_SQLITE_PRAGMA
+        return f"{pragmas},cache_size=-{self._sqlite_cache_mb(fast_mode) * 1024}"
+    
     def _build_ogr2ogr_command(self, layer_name: str, overwrite: bool, is_first: bool, 
-                                fast_mode: bool = False) -> list:
+                                fast_mode: bool = False, output_path: Optional[Path] = None) -> list:
         """
         Construit la commande ogr2ogr pour convertir une couche.
         
@@ -1595,6 +2789,7 @@ class GDBToSpatialiteConverter:
             overwrite: Si True, écrase le fichier de sortie
             is_first: Si True, c'est la première couche (création du fichier)
             fast_mode: Si True, active les optimisations agressives (sécurité réduite)
+            output_path: Fichier cible (par défaut le fichier de sortie)
             
         Returns:
             Liste des arguments de la commande ogr2ogr
@@ -1603,38 +2798,111 @@ class GDBToSpatialiteConverter:
             'ogr2ogr',
             '-f', 'SQLite',
             '-dsco', 'SPATIALITE=YES',
-            '-progress',  # Afficher la progression
         ]
+        if self._show_ogr2ogr_progress():
+            cmd.append('-progress')  # Afficher la progression
         
-        # Options de performance SQLite (toujours activées)
-        # Note: Les optimisations SQLite (PRAGMA) sont appliquées après conversion
-        # via _optimize_spatialite_database() car ogr2ogr ne supporte pas ces options
+        # Options de performance SQLite (toujours activées) : les PRAGMA sont
+        # appliqués par le driver SQLite de GDAL pendant l'écriture elle-même
+        # (les réglages de la base servie sont appliqués après conversion
+        # par _optimize_spatialite_database())
         cmd.extend([
-            '-dsco', 'INIT_WITH_EPSG=NO',  # Éviter la réinitialisation si déjà fait
+            '--config', 'OGR_SQLITE_PRAGMA', self._sqlite_load_pragmas(fast_mode),
+            '--config', 'OGR_SQLITE_CACHE', str(self._sqlite_cache_mb(fast_mode)),  # Mo
+            # spatial_ref_sys créée vide (pas d'insertion des milliers de SRS
+            # EPSG à chaque base, y compris chaque base temporaire) : seuls
+            # les SRS des couches converties y sont ajoutés
+            '-dsco', 'INIT_WITH_EPSG=NO',
         ])
         
-        # Options de couche (index spatiaux MUST HAVE)
+        # Options de couche (index spatial MUST HAVE, créé après le chargement
+        # des données par _create_spatial_indexes() : construction en une passe
+        # au lieu d'une mise à jour du R*Tree à chaque entité)
         cmd.extend([
-            '-lco', 'SPATIAL_INDEX=YES',  # Créer l'index spatial immédiatement (MUST HAVE)
+            '-lco', 'SPATIAL_INDEX=NO',
             '-lco', 'GEOMETRY_NAME=geometry',  # Nom standardisé
         ])
         
+        # GDAL >= 3.8 : transfert par lots en colonnes (API Arrow) depuis
+        # OpenFileGDB ; grandes transactions dans ce cas et en fast_mode
+        # (ogr2ogr valide par défaut toutes les 100 000 entités seulement
+        # à partir de GDAL 3.8)
+        use_arrow = bool(self._ogr2ogr_gdal_version and self._ogr2ogr_gdal_version >= (3, 8))
+        if use_arrow:
+            cmd.extend(['--config', 'OGR2OGR_USE_ARROW_API', 'YES'])
+        if use_arrow or fast_mode:
+            cmd.extend(['-gt', str(_TRANSACTION_SIZE)])
+        
+        target_path = output_path or self.output_path
         if is_first and overwrite:
             cmd.extend(['-overwrite'])
-        elif not is_first:
-            cmd.extend(['-update'])
+        elif not is_first or target_path.exists():
+            cmd.extend(['-update'])  # Base existante (couches suivantes ou reprise)
         
-        # Pour OpenFileGDB, on spécifie la couche avec l'option -sql
-        cmd.extend([
-            str(self.output_path),
-            str(self.gdb_path),
-            '-sql', f'SELECT * FROM "{layer_name}"'
-        ])
+        cmd.extend([str(target_path), str(self.gdb_path)])
+        cmd.extend(self._ogr2ogr_layer_args(layer_name))
+        return cmd
+    
+    @staticmethod
+    def _ogr2ogr_layer_args(layer_name: str) -> list:
+        """
+        Retourne les arguments ogr2ogr désignant la couche source.
+        
+        Args:
+            layer_name: Nom de la couche à convertir
+            
+        Returns:
+            Arguments à placer après la source
+        """
+        # Couche passée directement (lecteur natif OpenFileGDB, flux Arrow possible) ;
+        # un nom commençant par '-' serait pris pour une option : passer par -sql
+        if layer_name.startswith('-'):
+            return ['-sql', f'SELECT * FROM {_quote_identifier(layer_name)}', '-nln', layer_name]
+        return [layer_name]
+    
+    def _parquet_path(self, layer_name: str, partial: bool = False) -> Path:
+        """
+        Retourne le fichier Parquet d'une couche dans le dossier de sortie.
+        
+        Args:
+            layer_name: Nom de la couche
+            partial: Si True, retourne le fichier temporaire écrit pendant l'export
+                     (renommé une fois l'export réussi)
+            
+        Returns:
+            Chemin <sortie>/<couche>.parquet (caractères non sûrs remplacés par '_'),
+            suffixé de .partial pour le fichier temporaire
+        """
+        name = f"{_UNSAFE_FILENAME_RE.sub('_', layer_name)}.parquet"
+        return self.output_path / (f"{name}.partial" if partial else name)
+    
+    def _build_parquet_command(self, layer_name: str) -> list:
+        """
+        Construit la commande ogr2ogr d'export d'une couche en GeoParquet.
         
+        Args:
+            layer_name: Nom de la couche à convertir
+            
+        Returns:
+            Liste des arguments de la commande ogr2ogr
+        """
+        cmd = ['ogr2ogr', '-f', 'Parquet']
+        if self._show_ogr2ogr_progress():
+            cmd.append('-progress')
+        for option in _PARQUET_LAYER_OPTIONS:
+            cmd.extend(['-lco', option])
+        
+        # Lecture en colonnes (API Arrow) de bout en bout avec GDAL >= 3.8
+        if self._ogr2ogr_gdal_version and self._ogr2ogr_gdal_version >= (3, 8):
+            cmd.extend(['--config', 'OGR2OGR_USE_ARROW_API', 'YES'])
+        
+        cmd.extend([str(self._parquet_path(layer_name, partial=True)), str(self.gdb_path)])
+        cmd.extend(self._ogr2ogr_layer_args(layer_name))
         return cmd
     
     def _convert_layer_with_ogr2ogr(self, layer_name: str, overwrite: bool, is_first: bool,
-                                    fast_mode: bool = False) -> Tuple[str, bool, str]:
+                                    fast_mode: bool = False,
+                                    output_path: Optional[Path] = None) -> Tuple[str, bool, str]:
         """
         Convertit une couche en utilisant ogr2ogr.
         
@@ -1643,45 +2911,20 @@ class GDBToSpatialiteConverter:
             overwrite: Si True, écrase le fichier de sortie
             is_first: Si True, c'est la première couche (création du fichier)
             fast_mode: Si True, active les optimisations agressives
+            output_path: Fichier cible (par défaut le fichier de sortie)
             
         Returns:
             Tuple (layer_name, success, error_message)
         """
-        try:
-            # Construire la commande ogr2ogr
-            cmd = self._build_ogr2ogr_command(layer_name, overwrite, is_first, fast_mode)
-            self.logger.debug(f"Commande ogr2ogr: {' '.join(cmd)}")
-            
-            # Lancer la conversion avec capture de la progression
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Utiliser ProcessMonitor pour gérer le monitoring
-            monitor = ProcessMonitor(process, self.logger, layer_name)
-            monitor.start_monitoring()
-            output_lines, return_code = monitor.wait_for_completion()
-            
-            if return_code == 0:
-                self.logger.info(f"✓ Couche '{layer_name}' convertie avec succès")
-                return (layer_name, True, "")
-            else:
-                error_msg = "\n".join(output_lines[-10:])  # Dernières 10 lignes
-                self.logger.error(f"✗ Erreur lors de la conversion de '{layer_name}': {error_msg}")
-                return (layer_name, False, error_msg)
-                
-        except Exception as e:
-            error_msg = str(e)
-            self.logger.error(f"✗ Exception lors de la conversion de '{layer_name}': {error_msg}")
-            return (layer_name, False, error_msg)
+        # Construire la commande ogr2ogr
+        cmd = self._build_ogr2ogr_command(layer_name, overwrite, is_first, fast_mode, output_path)
+        self.logger.debug(f"Commande ogr2ogr: {' '.join(cmd)}")
+        
+        return _run_ogr2ogr(cmd, layer_name, self.logger, self._show_ogr2ogr_progress())
     
     def _prepare_conversion(self, layer_name: Optional[str], overwrite: bool, 
-                           use_ogr2ogr: bool, max_workers: int) -> dict:
+                           use_ogr2ogr: bool, max_workers: int, resume: bool = False,
+                           preserve_metadata: bool = True) -> dict:
         """
         Prépare la conversion en validant et récupérant les informations nécessaires.
         
@@ -1689,10 +2932,13 @@ class GDBToSpatialiteConverter:
             layer_name: Nom de la couche à convertir (None pour toutes)
             overwrite: Si True, écrase le fichier de sortie
             use_ogr2ogr: Si True, utilise ogr2ogr
-            max_workers: Nombre de threads demandé
+            max_workers: Nombre de processus de conversion demandé
+            resume: Si True, complète un fichier de sortie existant
+            preserve_metadata: Si True, une table reprise sans métadonnées est à finaliser
             
         Returns:
-            Dictionnaire avec: {'layers': list, 'use_ogr2ogr': bool, 'max_workers': int}
+            Dictionnaire avec: {'layers': list, 'use_ogr2ogr': bool, 'max_workers': int,
+            'up_to_date': bool}
         """
         self.logger.start_timer()
         self.logger.info("=" * 60)
@@ -1701,105 +2947,266 @@ class GDBToSpatialiteConverter:
         self.logger.info(f"Source: {self.gdb_path}")
         self.logger.info(f"Destination: {self.output_path}")
         
-        if self.output_path.exists() and not overwrite:
+        # Un seul accès aux métadonnées du fichier (coûteux sur un partage réseau)
+        output_exists = self.output_path.exists()
+        if output_exists and not overwrite and not resume:
             raise FileExistsError(
                 f"Le fichier de sortie existe déjà: {self.output_path}\n"
-                "Utilisez --overwrite pour l'écraser."
+                "Utilisez --overwrite pour l'écraser ou --resume pour le compléter."
             )
         
         # Vérifier ogr2ogr si demandé
+        # (version lue une seule fois par processus et par exécutable)
         if use_ogr2ogr:
-            try:
-                result = subprocess.run(['ogr2ogr', '--version'], 
-                                       capture_output=True, check=True)
-                ogr_version = result.stdout.decode().strip().split('\n')[0]
+            ogr2ogr_path = shutil.which('ogr2ogr')
+            ogr_version = _probe_ogr2ogr(ogr2ogr_path) if ogr2ogr_path else None
+            if ogr_version is not None:
                 self.logger.info(f"ogr2ogr disponible: {ogr_version}")
-            except (subprocess.CalledProcessError, FileNotFoundError):
+                match = _GDAL_VERSION_RE.search(ogr_version)
+                if match:
+                    self._ogr2ogr_gdal_version = (int(match.group(1)), int(match.group(2)))
+            else:
                 self.logger.warning("ogr2ogr n'est pas disponible, utilisation de l'API Python GDAL...")
                 use_ogr2ogr = False
         
-        # Obtenir la liste des couches à convertir
-        all_layers = self.get_layers()
-        layers_to_convert = [layer_name] if layer_name else all_layers
+        # Obtenir la liste des couches à convertir (une couche demandée est
+        # ouverte directement par son nom, sans énumérer la géodatabase)
+        layers_to_convert = [layer_name] if layer_name else self.get_layers()
+        if layer_name and not self._open_single_layer(layer_name):
+            layers_to_convert = []
         
         if not layers_to_convert:
             self.logger.error("Aucune couche à convertir")
-            return {'layers': [], 'use_ogr2ogr': False, 'max_workers': 1}
+            return {'layers': [], 'use_ogr2ogr': False, 'max_workers': 1, 'up_to_date': False}
         
-        self.logger.info(f"Couches à convertir: {len(layers_to_convert)}")
+        # Reprise : ignorer les couches déjà présentes dans la base existante
+        if resume and not overwrite and output_exists:
+            if self.output_format == 'parquet':
+                remaining = [layer for layer in layers_to_convert
+                             if not self._parquet_path(layer).exists()]
+            else:
+                # Une table interrompue (moins de lignes que d'entités dans la
+                # source) sera supprimée au début de la conversion puis
+                # convertie à nouveau ; une table complète à laquelle manquent
+                # l'index spatial ou les métadonnées est seulement finalisée
+                remaining = []
+                for layer in layers_to_convert:
+                    table_name = self._get_spatialite_table_name(layer)
+                    if table_name is None:
+                        remaining.append(layer)
+                    elif not self._is_table_complete(layer, table_name):
+                        self._incomplete_tables.append(table_name)
+                        remaining.append(layer)
+                    elif self._needs_post_pass(table_name, preserve_metadata):
+                        self._resumed_layers.append(layer)
+                if self._incomplete_tables:
+                    self.logger.info(
+                        f"Reprise: {len(self._incomplete_tables)} couche(s) incomplète(s) à reconvertir: "
+                        f"{', '.join(self._incomplete_tables)}"
+                    )
+                if self._resumed_layers:
+                    self.logger.info(
+                        f"Reprise: {len(self._resumed_layers)} couche(s) sans index spatial "
+                        f"ou métadonnées à finaliser"
+                    )
+            skipped = len(layers_to_convert) - len(remaining)
+            if skipped:
+                self.logger.info(f"Reprise: {skipped} couche(s) déjà présente(s) ignorée(s)")
+            layers_to_convert = remaining
+            if not layers_to_convert:
+                self.logger.info("✓ Toutes les couches sont déjà converties")
+                return {'layers': [], 'use_ogr2ogr': use_ogr2ogr, 'max_workers': 1, 'up_to_date': True}
+        
+        # Récapitulatif en un seul message, avec les nombres d'entités lus
+        # par get_layers() (aucun parcours de couche supplémentaire)
+        summary = [f"Couches à convertir: {len(layers_to_convert)}"]
         for i, layer in enumerate(layers_to_convert, 1):
-            info = self._get_layer_info(layer)
-            if info:
-                self.logger.info(f"  {i}. {layer}: {info.get('feature_count', '?')} entités")
+            feature_count = self._feature_counts.get(layer, -1)
+            summary.append(f"  {i}. {layer}: {feature_count if feature_count >= 0 else '?'} entités")
+        self.logger.info("\n".join(summary))
         
         # Supprimer le fichier existant si overwrite est activé
-        if self.output_path.exists() and overwrite:
+        # (en Parquet, le dossier est conservé : seuls les fichiers des couches
+        # converties sont remplacés)
+        if output_exists and overwrite and self.output_format != 'parquet':
             self.logger.info(f"Suppression du fichier existant: {self.output_path}")
-            self.output_path.unlink()
-        
-        # Détecter si plusieurs couches vont vers un seul fichier
-        # SQLite ne supporte pas bien l'accès concurrent multi-processus
-        if len(layers_to_convert) > 1 and max_workers > 1:
-            self.logger.warning("=" * 60)
-            self.logger.warning("ATTENTION: Parallélisation désactivée")
-            self.logger.warning("=" * 60)
-            self.logger.warning(
-                "Plusieurs couches sont converties vers un seul fichier SQLite.\n"
-                "SQLite ne supporte pas l'accès concurrent en écriture depuis\n"
-                "plusieurs processus. La conversion sera effectuée séquentiellement\n"
-                "pour garantir la fiabilité."
+            try:
+                self.output_path.unlink()
+            except FileNotFoundError:
+                pass  # Supprimé entre-temps
+            output_exists = False
+        self._output_created = not output_exists
+        
+        # Plusieurs couches en parallèle: chaque worker écrit son propre fichier
+        # SQLite (SQLite ne supporte pas l'écriture concurrente dans un même
+        # fichier), les fichiers sont fusionnés à la fin de la conversion
+        if len(layers_to_convert) > 1 and max_workers > 1 and use_ogr2ogr and self.output_format != 'parquet':
+            self.logger.info(
+                f"Conversion parallèle ({max_workers} workers): une base temporaire "
+                "par processus, fusionnée dans le fichier de sortie à la fin"
             )
-            self.logger.warning("=" * 60)
-            max_workers = 1
         
         return {
             'layers': layers_to_convert,
             'use_ogr2ogr': use_ogr2ogr,
-            'max_workers': max_workers
+            'max_workers': max_workers,
+            'up_to_date': False
         }
     
+    @staticmethod
+    def _table_name_candidates(layer_name: str) -> List[str]:
+        """
+        Liste les noms de table possibles (casefold) d'une couche.
+        
+        Args:
+            layer_name: Nom de la couche dans la géodatabase
+            
+        Returns:
+            Variantes sans doublons (ogr2ogr peut changer la casse et les séparateurs)
+        """
+        # La plupart des noms n'ont ni tiret ni espace
+        return list(dict.fromkeys((
+            layer_name.casefold(),
+            layer_name.replace('-', '_').casefold(),
+            layer_name.replace(' ', '_').casefold()
+        )))
+    
     def _get_spatialite_table_name(self, layer_name: str) -> Optional[str]:
         """
         Récupère le nom réel de la table dans Spatialite.
         
+        Les noms de tables sont lus une seule fois depuis sqlite_master (via la
+        connexion partagée de l'applicateur) puis résolus sans tenir compte de
+        la casse. Le cache est relu si une couche n'y figure pas encore.
+        
         Args:
             layer_name: Nom de la couche dans la géodatabase
             
         Returns:
             Nom de la table dans Spatialite ou None si introuvable
         """
-        if not self.output_path.exists():
-            return None
+        candidates = self._table_name_candidates(layer_name)
+        
+        for refresh in (self._table_name_cache is None, self._table_name_cache is not None):
+            if refresh:
+                # Ne pas créer de base vide en ouvrant la connexion
+                if not self.output_path.exists():
+                    return None
+                try:
+                    cursor = self.metadata_applier.get_connection().execute(
+                        "SELECT name FROM sqlite_master WHERE type='table'"
+                    )
+                    self._table_name_cache = {name.casefold(): name for (name,) in cursor}
+                except sqlite3.Error as e:
+                    self.logger.debug(f"Erreur lors de la recherche de la table {layer_name}: {e}")
+                    return None
+            
+            for candidate in candidates:
+                table_name = self._table_name_cache.get(candidate)
+                if table_name:
+                    return table_name
+        
+        return None
+    
+    def _is_table_complete(self, layer_name: str, table_name: str) -> bool:
+        """
+        Vérifie qu'une table de la sortie contient toutes les entités de la couche.
         
+        Args:
+            layer_name: Nom de la couche dans la géodatabase
+            table_name: Nom de la table dans Spatialite
+            
+        Returns:
+            True si le nombre de lignes correspond (ou si le nombre d'entités
+            de la source n'est pas connu sans parcourir la couche)
+        """
+        expected = self._feature_counts.get(layer_name, -1)
+        if expected < 0:
+            return True
         try:
-            conn = sqlite3.connect(str(self.output_path))
-            cursor = conn.cursor()
-            
-            # Chercher la table (peut être en minuscules, majuscules, ou tel quel)
-            # Essayer différentes variantes
-            possible_names = [
-                layer_name,
-                layer_name.lower(),
-                layer_name.upper(),
-                layer_name.replace('-', '_'),
-                layer_name.replace(' ', '_')
-            ]
-            
-            for name in possible_names:
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name=?
-                """, (name,))
-                result = cursor.fetchone()
-                if result:
-                    conn.close()
-                    return result[0]
+            (count,) = self.metadata_applier.get_connection().execute(
+                f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}"
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.debug(f"Comptage impossible pour la table {table_name}: {e}")
+            return True
+        return count == expected
+    
+    def _needs_post_pass(self, table_name: str, preserve_metadata: bool) -> bool:
+        """
+        Vérifie si une table reprise doit encore recevoir son index spatial
+        ou ses métadonnées (conversion interrompue avant les post-traitements).
+        
+        Args:
+            table_name: Nom de la table dans Spatialite
+            preserve_metadata: Si True, l'absence de métadonnées compte
             
-            conn.close()
-            return None
-        except Exception as e:
-            self.logger.debug(f"Erreur lors de la recherche de la table {layer_name}: {e}")
-            return None
+        Returns:
+            True si la table est à finaliser
+        """
+        conn = self.metadata_applier.get_connection()
+        try:
+            row = conn.execute(
+                "SELECT f_geometry_column FROM geometry_columns WHERE lower(f_table_name) = lower(?)",
+                (table_name,)
+            ).fetchone()
+            if row is not None and conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND lower(name) = lower(?)",
+                (f"idx_{table_name}_{row[0]}",)
+            ).fetchone() is None:
+                return True
+        except sqlite3.Error as e:
+            self.logger.debug(f"Vérification de l'index spatial impossible pour {table_name}: {e}")
+            return True
+        return preserve_metadata and not self.metadata_applier.has_metadata(table_name)
+    
+    def _drop_output_layers(self, table_names: List[str], database_path: Optional[Path] = None):
+        """
+        Supprime des couches du fichier de sortie via le driver SQLite de GDAL
+        (table, index spatial et métadonnées SpatiaLite).
+        
+        Args:
+            table_names: Noms des tables à supprimer
+            database_path: Base à modifier (par défaut le fichier de sortie)
+        """
+        # Aucune connexion ne doit rester ouverte sur la sortie
+        self.metadata_applier.close()
+        self._table_name_cache = None
+        
+        database_path = database_path or self.output_path
+        dest_ds = ogr.GetDriverByName("SQLite").Open(str(database_path), 1)
+        if dest_ds is None:
+            raise RuntimeError(f"Impossible d'ouvrir le fichier de sortie: {database_path}")
+        try:
+            to_drop = {name.casefold() for name in table_names}
+            # Index décroissants : une suppression ne décale pas les suivants
+            for i in reversed(range(dest_ds.GetLayerCount())):
+                if dest_ds.GetLayerByIndex(i).GetName().casefold() in to_drop:
+                    dest_ds.DeleteLayer(i)
+        finally:
+            dest_ds = None
+    
+    def _post_pass_layers(self) -> List[str]:
+        """
+        Retourne les couches à finaliser (index spatiaux, métadonnées).
+        
+        Returns:
+            Couches conservées lors d'une reprise, puis couches converties
+        """
+        return self._resumed_layers + self._converted_layers
+    
+    @staticmethod
+    def _metadata_kinds(preserve_aliases: bool, preserve_domains: bool,
+                        preserve_primary_keys: bool, preserve_triggers: bool) -> Tuple[str, ...]:
+        """
+        Traduit les options de préservation en types de métadonnées à extraire.
+        
+        Returns:
+            Clés de GDBMetadataExtractor.METADATA_EXTRACTORS retenues
+        """
+        flags = (('field_aliases', preserve_aliases), ('domain_values', preserve_domains),
+                 ('primary_keys', preserve_primary_keys), ('triggers', preserve_triggers))
+        return tuple(kind for kind, enabled in flags if enabled)
     
     def _post_process_metadata(self, layer_name: str, 
                                preserve_aliases: bool = True,
@@ -1819,25 +3226,15 @@ class GDBToSpatialiteConverter:
         Returns:
             True si toutes les métadonnées sont appliquées avec succès
         """
-        if not self.output_path.exists():
-            return False
-        
+        # Existence du fichier vérifiée une fois par _post_process_all_metadata()
         try:
             self.logger.info(f"Application des métadonnées pour '{layer_name}'...")
             
-            # Extraire les métadonnées
-            metadata = self.metadata_extractor.extract_all_metadata(layer_name)
-            
-            # Filtrer selon les options
-            filtered_metadata = {}
-            if preserve_aliases:
-                filtered_metadata['field_aliases'] = metadata.get('field_aliases', {})
-            if preserve_domains:
-                filtered_metadata['domain_values'] = metadata.get('domain_values', {})
-            if preserve_primary_keys:
-                filtered_metadata['primary_keys'] = metadata.get('primary_keys', [])
-            if preserve_triggers:
-                filtered_metadata['triggers'] = metadata.get('triggers', [])
+            # Extraire uniquement les métadonnées demandées
+            kinds = self._metadata_kinds(preserve_aliases, preserve_domains,
+                                         preserve_primary_keys, preserve_triggers)
+            metadata = self.metadata_extractor.extract_all_metadata(layer_name, kinds)
+            filtered_metadata = {kind: metadata[kind] for kind in kinds}
             
             # Appliquer les métadonnées
             # Vérifier le nom réel de la table dans Spatialite (peut être en minuscules)
@@ -1858,66 +3255,169 @@ class GDBToSpatialiteConverter:
             self.logger.warning(f"Erreur lors de l'application des métadonnées pour {layer_name}: {e}")
             return False
     
-    def _optimize_spatialite_database(self, fast_mode: bool = False):
+    def _post_process_all_metadata(self, layer_names: List[str],
+                                   preserve_aliases: bool = True,
+                                   preserve_domains: bool = True,
+                                   preserve_primary_keys: bool = True,
+                                   preserve_triggers: bool = True):
         """
-        Optimise les paramètres SQLite/Spatialite après conversion.
-        
-        Configure les paramètres de performance pour améliorer les opérations futures.
-        Les index spatiaux sont déjà créés (MUST HAVE).
+        Applique les métadonnées de toutes les couches converties dans une
+        seule transaction, une fois les conversions terminées.
         
         Args:
-            fast_mode: Si True, optimisations agressives (sécurité réduite)
+            layer_names: Noms des couches converties
+            preserve_aliases: Si True, préserve les alias de champs
+            preserve_domains: Si True, préserve les domaines codés
+            preserve_primary_keys: Si True, préserve les clés primaires
+            preserve_triggers: Si True, préserve les triggers
         """
-        if not self.output_path.exists():
+        if not layer_names or not self.output_path.exists():
             return
         
         try:
-            conn = sqlite3.connect(str(self.output_path))
-            
-            # Activer l'extension spatialite si disponible
-            try:
-                conn.enable_load_extension(True)
-                conn.execute("SELECT load_extension('mod_spatialite')")
-            except:
-                pass
-            
-            # Optimisations modérées (par défaut)
-            pragmas = [
-                "PRAGMA synchronous = NORMAL;",  # Au lieu de FULL
-                "PRAGMA journal_mode = WAL;",   # Write-Ahead Logging (plus rapide)
-                "PRAGMA cache_size = -256000;",  # 256MB de cache
-                "PRAGMA temp_store = MEMORY;",   # Tables temporaires en mémoire
-            ]
-            
-            # Optimisations agressives (fast_mode)
-            if fast_mode:
-                pragmas = [
-                    "PRAGMA synchronous = OFF;",  # Désactiver complètement
-                    "PRAGMA journal_mode = OFF;",  # Désactiver le journal
-                    "PRAGMA cache_size = -512000;",  # 512MB de cache
-                    "PRAGMA temp_store = MEMORY;",
-                ]
+            with self.metadata_applier.transaction():
+                for layer_name in layer_names:
+                    self._post_process_metadata(
+                        layer_name, preserve_aliases, preserve_domains,
+                        preserve_primary_keys, preserve_triggers
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Erreur lors de l'enregistrement des métadonnées: {e}")
+    
+    def _execute_ogr_sql(self, dest_ds, sql: str):
+        """
+        Exécute une requête SQLite via la datasource GDAL et libère le résultat.
+        
+        Args:
+            dest_ds: Datasource SQLite ouverte en écriture
+            sql: Requête à exécuter
+        """
+        result = dest_ds.ExecuteSQL(sql, dialect='SQLITE')
+        if result is not None:
+            dest_ds.ReleaseResultSet(result)
+    
+    def _spatial_index_tables(self, dest_ds) -> set:
+        """
+        Liste les tables d'index spatial (idx_<table>_<géométrie>) de la sortie.
+        
+        Args:
+            dest_ds: Datasource SQLite ouverte
+            
+        Returns:
+            Noms des tables d'index (casefold)
+        """
+        names = set()
+        try:
+            result = dest_ds.ExecuteSQL(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'idx\\_%' ESCAPE '\\'",
+                dialect='SQLITE'
+            )
+        except RuntimeError as e:
+            self.logger.debug(f"Lecture des index spatiaux impossible: {e}")
+            return names
+        if result is not None:
+            try:
+                for feature in result:
+                    names.add(feature.GetField(0).casefold())
+            finally:
+                dest_ds.ReleaseResultSet(result)
+        return names
+    
+    def _create_spatial_indexes(self, dest_ds, layer_names: List[str]):
+        """
+        Crée les index spatiaux des couches après le chargement des données.
+        
+        Passe par le driver SQLite de GDAL, qui gère CreateSpatialIndex() même
+        si mod_spatialite n'est pas chargeable depuis le module sqlite3.
+        
+        Args:
+            dest_ds: Datasource SQLite ouverte en écriture
+            layer_names: Noms des couches converties
+        """
+        # Index déjà présents (couches finalisées par une conversion précédente)
+        existing = self._spatial_index_tables(dest_ds)
+        
+        # Tous les index dans une seule transaction (une seule synchronisation disque)
+        created = 0
+        dest_ds.StartTransaction()
+        try:
+            for layer_name in layer_names:
+                layer = dest_ds.GetLayerByName(layer_name)
+                if layer is None or not layer.GetGeometryColumn():
+                    continue  # Table sans géométrie
+                if f"idx_{layer.GetName()}_{layer.GetGeometryColumn()}".casefold() in existing:
+                    continue
+                
+                table = layer.GetName().replace("'", "''")
+                geometry_column = layer.GetGeometryColumn().replace("'", "''")
+                try:
+                    self._execute_ogr_sql(dest_ds, f"SELECT CreateSpatialIndex('{table}', '{geometry_column}')")
+                    created += 1
+                except RuntimeError as e:
+                    self.logger.warning(f"Échec de la création de l'index spatial pour '{layer_name}': {e}")
+        finally:
+            dest_ds.CommitTransaction()
+        
+        if created:
+            self.logger.info(f"✓ {created} index spatial(aux) créé(s)")
+    
+    def _optimize_spatialite_database(self, fast_mode: bool = False):
+        """
+        Optimise les paramètres SQLite/Spatialite après conversion.
+        
+        Configure les paramètres de performance pour améliorer les opérations futures.
+        Les index spatiaux (MUST HAVE) sont d'abord créés pour les couches converties.
+        Appelée après le passage des métadonnées, pour qu'ANALYZE couvre leurs
+        tables et index ; tout passe par une seule datasource GDAL.
+        
+        Args:
+            fast_mode: Si True, optimisations agressives (sécurité réduite)
+        """
+        if not self.output_path.exists():
+            return
+        
+        self.metadata_applier.close()  # Aucun autre accès pendant l'optimisation
+        try:
+            dest_ds = ogr.Open(str(self.output_path), 1)
+        except RuntimeError as e:
+            self.logger.warning(f"Impossible d'ouvrir la base pour l'optimiser: {e}")
+            return
+        if dest_ds is None:
+            return
+        
+        try:
+            self._create_spatial_indexes(dest_ds, self._post_pass_layers())
+            
+            pragmas = _OPTIMIZE_PRAGMAS
+            if fast_mode:
+                pragmas = _OPTIMIZE_PRAGMAS_FAST
                 self.logger.info("Optimisations agressives activées (fast_mode)")
             
+            # Une requête par appel : ExecuteSQL ne compile que la première
+            # instruction d'un script
             for pragma in pragmas:
                 try:
-                    conn.execute(pragma)
-                except Exception as e:
+                    self._execute_ogr_sql(dest_ds, pragma)
+                except RuntimeError as e:
                     self.logger.debug(f"Erreur lors de l'exécution de {pragma}: {e}")
             
             # Analyser les statistiques pour optimiser les requêtes
             try:
-                conn.execute("ANALYZE;")
-            except:
-                pass
+                self._execute_ogr_sql(dest_ds, "ANALYZE")
+            except RuntimeError as e:
+                self.logger.debug(f"Erreur lors de l'analyse des statistiques: {e}")
             
-            conn.commit()
-            conn.close()
+            # Reporter le journal WAL dans le fichier principal : la base livrée
+            # est un fichier unique, lisible sans son fichier -wal
+            if not fast_mode:
+                try:
+                    self._execute_ogr_sql(dest_ds, "PRAGMA wal_checkpoint(TRUNCATE)")
+                except RuntimeError as e:
+                    self.logger.debug(f"Erreur lors du checkpoint WAL: {e}")
             
             self.logger.info("✓ Base SQLite optimisée pour les performances")
-        
-        except Exception as e:
-            self.logger.debug(f"Erreur lors de l'optimisation de la base: {e}")
+        finally:
+            dest_ds = None  # Fermer la datasource (écriture sur disque)
     
     def convert(self, layer_name: Optional[str] = None, overwrite: bool = False, 
                 max_workers: int = 1, use_ogr2ogr: bool = True,
@@ -1926,14 +3426,17 @@ class GDBToSpatialiteConverter:
                 preserve_domains: bool = True,
                 preserve_primary_keys: bool = True,
                 preserve_triggers: bool = True,
-                fast_mode: bool = False) -> bool:
+                fast_mode: bool = False,
+                resume: bool = False,
+                cache_mb: Optional[int] = None,
+                output_format: str = 'sqlite') -> bool:
         """
         Convertit la géodatabase en Spatialite.
         
         Args:
             layer_name: Nom de la couche à convertir (None pour toutes les couches)
             overwrite: Si True, écrase le fichier de sortie s'il existe
-            max_workers: Nombre de threads pour la conversion parallèle (1 = séquentiel)
+            max_workers: Nombre de processus ogr2ogr en parallèle (1 = séquentiel)
             use_ogr2ogr: Si True, utilise ogr2ogr (plus fiable), sinon API Python
             preserve_metadata: Si True, préserve les métadonnées (alias, domaines, etc.)
             preserve_aliases: Si True, préserve les alias de champs
@@ -1941,28 +3444,201 @@ class GDBToSpatialiteConverter:
             preserve_primary_keys: Si True, préserve les clés primaires
             preserve_triggers: Si True, préserve les triggers
             fast_mode: Si True, active les optimisations agressives (sécurité réduite)
+            resume: Si True, complète un fichier existant avec les couches manquantes
+            cache_mb: Cache SQLite de chargement en Mo, par processus ogr2ogr
+                      (None : ajusté à la mémoire disponible)
+            output_format: 'sqlite' (Spatialite) ou 'parquet' (un fichier
+                           GeoParquet par couche, sans métadonnées ESRI)
             
         Returns:
             True si la conversion réussit, False sinon
         """
-        prep = self._prepare_conversion(layer_name, overwrite, use_ogr2ogr, max_workers)
+        self._converted_layers = []
+        self._resumed_layers = []
+        self._incomplete_tables = []
+        self._table_name_cache = None
+        self.metadata_applier.close()
+        self.metadata_applier.fast_mode = fast_mode
+        if output_format not in _OUTPUT_FORMATS:
+            raise ValueError(f"Format de sortie inconnu: {output_format}")
+        self.output_format = output_format
+        prep = self._prepare_conversion(layer_name, overwrite, use_ogr2ogr, max_workers, resume,
+                                        preserve_metadata)
         
         if not prep['layers']:
-            return False
+            try:
+                # Reprise sans couche à convertir : finaliser les couches présentes
+                if self._resumed_layers:
+                    if preserve_metadata:
+                        self._post_process_all_metadata(
+                            self._resumed_layers, preserve_aliases, preserve_domains,
+                            preserve_primary_keys, preserve_triggers
+                        )
+                    self._optimize_spatialite_database(fast_mode)
+            finally:
+                self.metadata_extractor.close()
+                self.metadata_applier.close()
+            return prep['up_to_date']
+        
+        if output_format == 'parquet':
+            # Export en colonnes : ni base Spatialite, ni métadonnées, ni index
+            if preserve_metadata:
+                self.logger.info("Format Parquet: les métadonnées ESRI ne sont pas préservées")
+            try:
+                return self._convert_to_parquet(
+                    prep['layers'], prep['use_ogr2ogr'], prep['max_workers']
+                )
+            finally:
+                self.metadata_extractor.close()
+        
+        # Cache ajusté automatiquement : partagé entre les processus simultanés
+        self._cache_mb = cache_mb
+        if cache_mb is None:
+            self._cache_mb = _auto_cache_mb(self.gdb_path)
+            parallel = min(prep['max_workers'], len(prep['layers'])) if prep['use_ogr2ogr'] else 1
+            if self._cache_mb and parallel > 1:
+                self._cache_mb = max(_SQLITE_CACHE_MB_MIN, self._cache_mb // parallel)
+        if self._cache_mb:
+            self.logger.debug(f"Cache SQLite de chargement: {self._cache_mb} Mo")
         
-        # Conversion
-        if prep['use_ogr2ogr']:
-            return self._convert_with_ogr2ogr_parallel(
-                prep['layers'], overwrite, prep['max_workers'],
-                preserve_metadata, preserve_aliases, preserve_domains, 
-                preserve_primary_keys, preserve_triggers, fast_mode
-            )
-        else:
-            return self._convert_with_python_api(
-                prep['layers'], overwrite,
-                preserve_metadata, preserve_aliases, preserve_domains,
-                preserve_primary_keys, preserve_triggers, fast_mode
+        try:
+            # Extraire les métadonnées de toutes les couches en parallèle
+            # (les post-traitements par couche lisent ensuite le cache)
+            kinds = self._metadata_kinds(preserve_aliases, preserve_domains,
+                                         preserve_primary_keys, preserve_triggers)
+            if preserve_metadata and kinds and len(prep['layers']) > 1:
+                self.metadata_extractor.extract_all_metadata_bulk(prep['layers'], kinds)
+            
+            # Supprimer les tables interrompues juste avant de les reconvertir
+            if self._incomplete_tables:
+                self._drop_output_layers(self._incomplete_tables)
+            
+            # Conversion
+            if prep['use_ogr2ogr']:
+                return self._convert_with_ogr2ogr_parallel(
+                    prep['layers'], overwrite, prep['max_workers'],
+                    preserve_metadata, preserve_aliases, preserve_domains, 
+                    preserve_primary_keys, preserve_triggers, fast_mode
+                )
+            else:
+                return self._convert_with_python_api(
+                    prep['layers'], overwrite,
+                    preserve_metadata, preserve_aliases, preserve_domains,
+                    preserve_primary_keys, preserve_triggers, fast_mode
+                )
+        finally:
+            # Libérer les handles de fichiers de la géodatabase et de la sortie
+            self.metadata_extractor.close()
+            self.metadata_applier.close()
+    
+    def _convert_to_parquet(self, layers: list, use_ogr2ogr: bool, max_workers: int) -> bool:
+        """
+        Exporte les couches en GeoParquet, un fichier par couche.
+        
+        Chaque couche ayant son propre fichier, les exports ogr2ogr sont
+        lancés en parallèle sans base temporaire ni fusion.
+        
+        Args:
+            layers: Liste des couches à convertir
+            use_ogr2ogr: Si True, utilise ogr2ogr, sinon gdal.VectorTranslate
+            max_workers: Nombre de processus ogr2ogr simultanés
+            
+        Returns:
+            True si au moins une conversion réussit
+        """
+        self.logger.info(f"Export GeoParquet (max_workers={max_workers})")
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        
+        # Le driver Parquet ne met pas à jour un fichier existant : remplacer
+        # ceux des couches demandées (--overwrite) et les exports interrompus
+        for layer in layers:
+            for path in (self._parquet_path(layer), self._parquet_path(layer, partial=True)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+        
+        results = {}
+        with self._progress_bar_context(len(layers)) as progress_bar:
+            if use_ogr2ogr:
+                _run_coroutine(self._run_parquet_exports(layers, max_workers, results, progress_bar))
+            else:
+                for layer in layers:
+                    results[layer] = self._export_parquet_with_python_api(layer)
+                    if progress_bar:
+                        progress_bar.update(1)
+        
+        # Un fichier .parquet n'apparaît qu'une fois complet : --resume peut s'y fier
+        for layer in layers:
+            partial = self._parquet_path(layer, partial=True)
+            if results[layer][0]:
+                try:
+                    os.replace(partial, self._parquet_path(layer))
+                except OSError as e:
+                    results[layer] = (False, f"Renommage impossible: {e}")
+            if not results[layer][0]:
+                try:
+                    partial.unlink()
+                except FileNotFoundError:
+                    pass
+        
+        failed_layers = [(layer, results[layer][1]) for layer in layers if not results[layer][0]]
+        self._converted_layers = [layer for layer in layers if results[layer][0]]
+        self._display_conversion_summary(
+            len(self._converted_layers), len(layers), failed_layers, self.output_path
+        )
+        return bool(self._converted_layers)
+    
+    async def _run_parquet_exports(self, layers: list, max_workers: int,
+                                   results: dict, progress_bar):
+        """
+        Exécute les exports ogr2ogr, au plus max_workers à la fois.
+        
+        Args:
+            layers: Liste des couches à convertir
+            max_workers: Nombre de processus ogr2ogr simultanés
+            results: Dictionnaire rempli {couche: (success, error)}
+            progress_bar: Barre de progression (ou None)
+        """
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        show_progress = self._show_ogr2ogr_progress()
+        
+        async def run_layer(layer: str):
+            async with semaphore:
+                cmd = self._build_parquet_command(layer)
+                self.logger.debug(f"Commande ogr2ogr: {' '.join(cmd)}")
+                _, success, error = await _run_ogr2ogr_async(cmd, layer, self.logger, show_progress)
+                results[layer] = (success, error)
+            if progress_bar:
+                progress_bar.update(1)
+        
+        await asyncio.gather(*(run_layer(layer) for layer in layers))
+    
+    def _export_parquet_with_python_api(self, layer_name: str) -> Tuple[bool, str]:
+        """
+        Exporte une couche en GeoParquet avec gdal.VectorTranslate.
+        
+        Args:
+            layer_name: Nom de la couche à convertir
+            
+        Returns:
+            Tuple (success, error_message)
+        """
+        try:
+            result = gdal.VectorTranslate(
+                str(self._parquet_path(layer_name, partial=True)), str(self.gdb_path),
+                format='Parquet', layers=[layer_name],
+                layerCreationOptions=list(_PARQUET_LAYER_OPTIONS)
             )
+            if result is None:
+                raise RuntimeError("export impossible (driver Parquet disponible ?)")
+            result = None  # Fermer le fichier
+        except RuntimeError as e:
+            self.logger.error(f"✗ Erreur lors de la conversion de '{layer_name}': {e}")
+            return (False, str(e))
+        
+        self.logger.info(f"✓ Couche '{layer_name}' convertie avec succès")
+        return (True, "")
     
     def _convert_with_ogr2ogr_parallel(self, layers: list, overwrite: bool, max_workers: int,
                                       preserve_metadata: bool = True,
@@ -1977,18 +3653,16 @@ class GDBToSpatialiteConverter:
         Args:
             layers: Liste des couches à convertir
             overwrite: Si True, écrase le fichier de sortie
-            max_workers: Nombre de threads (sera forcé à 1 si plusieurs couches vers un seul fichier)
+            max_workers: Nombre de processus ogr2ogr (une base temporaire par processus si > 1)
             
         Returns:
             True si au moins une conversion réussit
         """
-        # Sécurité supplémentaire : vérifier si plusieurs couches vers un seul fichier
         if len(layers) > 1 and max_workers > 1:
-            self.logger.debug(
-                "Détection: plusieurs couches vers un seul fichier SQLite. "
-                f"Forçage max_workers à 1 (était {max_workers})"
+            return self._convert_with_ogr2ogr_sharded(
+                layers, max_workers, preserve_metadata, preserve_aliases,
+                preserve_domains, preserve_primary_keys, preserve_triggers, fast_mode
             )
-            max_workers = 1
         
         self.logger.info(f"Conversion avec ogr2ogr (max_workers={max_workers})")
         
@@ -1996,72 +3670,511 @@ class GDBToSpatialiteConverter:
         failed_layers = []
         
         with self._progress_bar_context(len(layers)) as progress_bar:
-            if max_workers == 1:
-                # Conversion séquentielle avec progression
-                for i, layer in enumerate(layers):
-                    is_first = (i == 0)
-                    self.logger.info(f"[{i+1}/{len(layers)}] Conversion de '{layer}'...")
-                    
-                    layer_name, success, error = self._convert_layer_with_ogr2ogr(
-                        layer, overwrite, is_first, fast_mode
-                    )
-                    
-                    if success:
-                        success_count += 1
-                        
-                        # Appliquer les métadonnées après conversion réussie
-                        if preserve_metadata:
-                            self._post_process_metadata(
-                                layer, preserve_aliases, preserve_domains,
-                                preserve_primary_keys, preserve_triggers
-                            )
-                    else:
-                        failed_layers.append((layer_name, error))
-                    
-                    if progress_bar:
-                        progress_bar.update(1)
-            else:
-                # Conversion parallèle
-                self.logger.info(f"Conversion parallèle avec {max_workers} workers")
+            # Conversion séquentielle avec progression
+            for i, layer in enumerate(layers):
+                is_first = (i == 0)
+                self.logger.info(f"[{i+1}/{len(layers)}] Conversion de '{layer}'...")
                 
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = []
-                    
-                    for i, layer in enumerate(layers):
-                        is_first = (i == 0)
-                        future = executor.submit(
-                            self._convert_layer_with_ogr2ogr,
-                            layer, overwrite, is_first, fast_mode
-                        )
-                        futures.append(future)
-                    
-                    # Traiter les résultats au fur et à mesure
-                    for future in as_completed(futures):
-                        layer_name, success, error = future.result()
-                        
-                        if success:
-                            success_count += 1
-                            
-                            # Appliquer les métadonnées après conversion réussie
-                            if preserve_metadata:
-                                self._post_process_metadata(
-                                    layer_name, preserve_aliases, preserve_domains,
-                                    preserve_primary_keys, preserve_triggers
-                                )
-                        else:
-                            failed_layers.append((layer_name, error))
-                        
-                        if progress_bar:
-                            progress_bar.update(1)
+                layer_name, success, error = self._convert_layer_with_ogr2ogr(
+                    layer, overwrite, is_first, fast_mode
+                )
+                
+                if success:
+                    success_count += 1
+                    self._converted_layers.append(layer)
+                else:
+                    failed_layers.append((layer_name, error))
+                
+                if progress_bar:
+                    progress_bar.update(1)
+        
+        # Appliquer les métadonnées de toutes les couches en une transaction
+        if preserve_metadata:
+            self._post_process_all_metadata(
+                self._post_pass_layers(), preserve_aliases, preserve_domains,
+                preserve_primary_keys, preserve_triggers
+            )
         
         self._display_conversion_summary(success_count, len(layers), failed_layers, self.output_path)
         
         # Optimiser la base SQLite après conversion
-        if success_count > 0:
+        if success_count > 0 or self._resumed_layers:
             self._optimize_spatialite_database(fast_mode)
         
         return success_count > 0
     
+    def _convert_with_ogr2ogr_sharded(self, layers: list, max_workers: int,
+                                      preserve_metadata: bool = True,
+                                      preserve_aliases: bool = True,
+                                      preserve_domains: bool = True,
+                                      preserve_primary_keys: bool = True,
+                                      preserve_triggers: bool = True,
+                                      fast_mode: bool = False) -> bool:
+        """
+        Convertit les couches en parallèle, une base SQLite temporaire par processus.
+        
+        Les processus ogr2ogr sont lancés depuis une boucle asyncio (aucun
+        thread ni processus Python intermédiaire). Chaque emplacement
+        d'exécution possède son propre fichier, ce qui évite les conflits de
+        verrou SQLite. Les fichiers sont ensuite fusionnés dans le fichier de
+        sortie via ATTACH (le premier est simplement renommé).
+        
+        Args:
+            layers: Liste des couches à convertir
+            max_workers: Nombre de processus ogr2ogr simultanés
+            
+        Returns:
+            True si au moins une conversion réussit
+        """
+        self.logger.info(f"Conversion parallèle avec {max_workers} workers")
+        
+        # Bases temporaires: <sortie>.shard<N><suffixe> ; supprimer celles
+        # laissées par une conversion interrompue
+        shard_prefix = f"{self.output_path.stem}.shard"
+        shard_suffix = self.output_path.suffix
+        for leftover in self.output_path.parent.iterdir():
+            name = leftover.name
+            if (name.startswith(shard_prefix) and name.endswith(shard_suffix)
+                    and name[len(shard_prefix):len(name) - len(shard_suffix)].isdigit()):
+                leftover.unlink()
+        
+        shards = [
+            self.output_path.with_name(f"{shard_prefix}{i}{shard_suffix}")
+            for i in range(min(max_workers, len(layers)))
+        ]
+        
+        results = {}
+        with self._progress_bar_context(len(layers)) as progress_bar:
+            _run_coroutine(self._run_ogr2ogr_shards(layers, shards, fast_mode, results, progress_bar))
+        
+        # Couches regroupées par base, fusionnées dans l'ordre de leur
+        # première couche pour un résultat reproductible
+        shard_layers: Dict[Path, List[str]] = {}
+        shard_failed: Dict[Path, List[str]] = {}
+        failed_layers = []
+        for layer in layers:
+            success, error, shard = results[layer]
+            if success:
+                shard_layers.setdefault(shard, []).append(layer)
+            else:
+                failed_layers.append((layer, error))
+                shard_failed.setdefault(shard, []).append(layer)
+        
+        converted = []
+        for shard, shard_layer_names in shard_layers.items():
+            try:
+                self._merge_shard(shard, shard_layer_names, shard_failed.get(shard, []))
+                converted.extend(shard_layer_names)
+            except (OSError, sqlite3.Error) as e:
+                failed_layers.extend((layer, f"Fusion impossible: {e}") for layer in shard_layer_names)
+        
+        for _, _, shard in results.values():
+            if shard.exists():
+                shard.unlink()
+        
+        # Conserver l'ordre demandé des couches
+        order = {layer: i for i, layer in enumerate(layers)}
+        converted.sort(key=order.__getitem__)
+        self._converted_layers.extend(converted)
+        
+        # Appliquer les métadonnées une fois la base fusionnée
+        if preserve_metadata:
+            self._post_process_all_metadata(
+                self._post_pass_layers(), preserve_aliases, preserve_domains,
+                preserve_primary_keys, preserve_triggers
+            )
+        
+        self._display_conversion_summary(len(converted), len(layers), failed_layers, self.output_path)
+        
+        # Optimiser la base SQLite après conversion
+        if converted or self._resumed_layers:
+            self._optimize_spatialite_database(fast_mode)
+        
+        return bool(converted)
+    
+    async def _run_ogr2ogr_shards(self, layers: list, shards: List[Path], fast_mode: bool,
+                                  results: dict, progress_bar):
+        """
+        Exécute ogr2ogr pour toutes les couches, au plus un processus par base
+        temporaire à la fois.
+        
+        Args:
+            layers: Liste des couches à convertir
+            shards: Bases temporaires (une par processus simultané)
+            fast_mode: Options de conversion rapides
+            results: Dictionnaire rempli {couche: (success, error, shard)}
+            progress_bar: Barre de progression (ou None)
+        """
+        # Bases libres : la file sert aussi de limite de parallélisme
+        free_shards = asyncio.Queue()
+        for shard in shards:
+            free_shards.put_nowait(shard)
+        show_progress = self._show_ogr2ogr_progress()
+        
+        async def run_layer(layer: str):
+            shard = await free_shards.get()
+            try:
+                # -update ajouté si la base a été créée par une couche précédente
+                cmd = self._build_ogr2ogr_command(layer, False, True, fast_mode, shard)
+                _, success, error = await _run_ogr2ogr_async(cmd, layer, self.logger, show_progress)
+                results[layer] = (success, error, shard)
+            finally:
+                free_shards.put_nowait(shard)
+            if progress_bar:
+                progress_bar.update(1)
+        
+        await asyncio.gather(*(run_layer(layer) for layer in layers))
+    
+    def _merge_shard(self, shard_path: Path, layer_names: List[str],
+                     failed_layer_names: Optional[List[str]] = None):
+        """
+        Fusionne une base temporaire dans le fichier de sortie.
+        
+        Si le fichier de sortie n'existe pas encore, la base est simplement
+        renommée. Sinon les tables des couches converties absentes de la
+        sortie sont recréées et copiées, ainsi que leurs index, triggers et
+        lignes de métadonnées SpatiaLite (geometry_columns, spatial_ref_sys, ...).
+        Les tables partielles des couches en échec ne sont jamais fusionnées.
+        
+        Args:
+            shard_path: Chemin de la base temporaire
+            layer_names: Couches converties avec succès dans cette base
+            failed_layer_names: Couches en échec dans cette base
+        """
+        # Aucune connexion ne doit rester ouverte sur la sortie
+        self.metadata_applier.close()
+        
+        if not self.output_path.exists():
+            if failed_layer_names:
+                self._drop_output_layers(
+                    [name for layer in failed_layer_names for name in self._table_name_candidates(layer)],
+                    shard_path
+                )
+            os.replace(shard_path, self.output_path)
+            return
+        
+        layer_tables = {name for layer in layer_names for name in self._table_name_candidates(layer)}
+        
+        conn = sqlite3.connect(str(self.output_path), isolation_level=None)
+        conn.create_function('_set_spatialite_blob_srid', 2, _set_spatialite_blob_srid)
+        try:
+            conn.execute("ATTACH DATABASE ? AS shard", (str(shard_path),))
+            try:
+                conn.execute("BEGIN")
+                try:
+                    main_tables = {
+                        row[0].casefold() for row in conn.execute(
+                            "SELECT name FROM main.sqlite_master WHERE type = 'table'"
+                        )
+                    }
+                    new_tables = [
+                        (name, sql) for name, sql in conn.execute(
+                            "SELECT name, sql FROM shard.sqlite_master "
+                            "WHERE type = 'table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'"
+                        )
+                        if name.casefold() in layer_tables and name.casefold() not in main_tables
+                    ]
+                    
+                    # Systèmes de coordonnées d'abord : les géométries des
+                    # systèmes renumérotés sont corrigées pendant la copie
+                    srid_map = {}
+                    if 'spatial_ref_sys' in main_tables:
+                        srid_map = self._merge_shard_srs(conn, [n for n, _ in new_tables])
+                    
+                    for name, sql in new_tables:
+                        conn.execute(sql)
+                        quoted = _quote_identifier(name)
+                        columns = self._shard_select_columns(conn, name, srid_map)
+                        conn.execute(f"INSERT INTO main.{quoted} SELECT {columns} FROM shard.{quoted}")
+                        # Index et triggers après la copie des données
+                        for (obj_sql,) in conn.execute(
+                            "SELECT sql FROM shard.sqlite_master "
+                            "WHERE type IN ('index', 'trigger') AND tbl_name = ? "
+                            "AND sql IS NOT NULL", (name,)
+                        ).fetchall():
+                            conn.execute(obj_sql)
+                    
+                    self._merge_shard_metadata(conn, main_tables, [n for n, _ in new_tables], srid_map)
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.execute("DETACH DATABASE shard")
+        finally:
+            conn.close()
+        
+        self.logger.debug(f"Base temporaire fusionnée: {shard_path.name}")
+    
+    @staticmethod
+    def _srs_definition(row: Mapping) -> Optional[tuple]:
+        """
+        Clé d'identité d'une ligne de spatial_ref_sys.
+        
+        Args:
+            row: Ligne {colonne: valeur}
+            
+        Returns:
+            (auth_name, auth_srid) si l'autorité est connue, sinon le srtext
+            (ou proj4text) ; None si la ligne ne décrit pas le système
+        """
+        if row.get('auth_name') and row.get('auth_srid') is not None:
+            return ('auth', row['auth_name'].casefold(), str(row['auth_srid']))
+        text = row.get('srtext') or row.get('proj4text')
+        return ('text', text) if text else None
+    
+    def _merge_shard_srs(self, conn: sqlite3.Connection, new_tables: List[str]) -> Dict[int, int]:
+        """
+        Copie les systèmes de coordonnées utilisés par les tables fusionnées.
+        
+        Chaque base temporaire numérote ses systèmes sans code EPSG à partir
+        du même srid : un système déjà présent dans la sortie (même autorité
+        ou, à défaut, même srtext) reprend son srid, et un srid déjà pris par
+        une autre définition est remplacé par un srid libre.
+        
+        Args:
+            conn: Connexion sur la sortie, avec la base temporaire attachée
+            new_tables: Tables copiées depuis la base temporaire
+            
+        Returns:
+            Correspondance {srid de la base temporaire: srid de la sortie}
+            des systèmes renumérotés
+        """
+        srids = set()
+        for name in new_tables:
+            try:
+                srids.update(srid for (srid,) in conn.execute(
+                    "SELECT srid FROM shard.geometry_columns WHERE f_table_name = ? COLLATE NOCASE",
+                    (name,)
+                ) if srid is not None)
+            except sqlite3.OperationalError:
+                return {}  # Base sans géométrie
+        if not srids:
+            return {}
+        
+        columns = [row[1] for row in conn.execute("PRAGMA main.table_info(spatial_ref_sys)")]
+        shard_columns = {row[1] for row in conn.execute("PRAGMA shard.table_info(spatial_ref_sys)")}
+        if not set(columns) <= shard_columns or 'srid' not in columns:
+            raise sqlite3.DatabaseError(
+                "Tables spatial_ref_sys incompatibles entre la sortie et la base temporaire"
+            )
+        column_list = ", ".join(_quote_identifier(column) for column in columns)
+        
+        def fetch(schema: str, where: str, params: tuple) -> List[dict]:
+            cursor = conn.execute(
+                f"SELECT {column_list} FROM {schema}.spatial_ref_sys WHERE {where}", params
+            )
+            return [dict(zip(columns, row)) for row in cursor]
+        
+        srid_map = {}
+        for srid in sorted(srids):
+            shard_rows = fetch('shard', "srid = ?", (srid,))
+            if not shard_rows:
+                continue
+            shard_row = shard_rows[0]
+            definition = self._srs_definition(shard_row)
+            
+            same_srid = fetch('main', "srid = ?", (srid,))
+            if not same_srid:
+                conn.execute(
+                    f"INSERT INTO main.spatial_ref_sys ({column_list}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    [shard_row[column] for column in columns]
+                )
+                continue
+            if definition is None or self._srs_definition(same_srid[0]) == definition:
+                continue
+            
+            # srid déjà pris par un autre système : chercher la même définition
+            if definition[0] == 'auth':
+                matches = fetch('main', "auth_name = ? COLLATE NOCASE AND CAST(auth_srid AS TEXT) = ?",
+                                definition[1:])
+            else:
+                text_column = 'srtext' if shard_row.get('srtext') else 'proj4text'
+                matches = fetch('main', f"{text_column} = ?", (definition[1],))
+            if matches:
+                srid_map[srid] = matches[0]['srid']
+            else:
+                (new_srid,) = conn.execute(
+                    "SELECT MAX(MAX(srid) + 1, ?) FROM main.spatial_ref_sys", (srid,)
+                ).fetchone()
+                shard_row['srid'] = new_srid
+                conn.execute(
+                    f"INSERT INTO main.spatial_ref_sys ({column_list}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    [shard_row[column] for column in columns]
+                )
+                srid_map[srid] = new_srid
+            self.logger.debug(f"Système de coordonnées renuméroté à la fusion: {srid} -> {srid_map[srid]}")
+        
+        return srid_map
+    
+    def _shard_select_columns(self, conn: sqlite3.Connection, table_name: str,
+                              srid_map: Dict[int, int]) -> str:
+        """
+        Liste de colonnes pour copier une table de la base temporaire,
+        en corrigeant le SRID des géométries dont le système est renuméroté.
+        
+        Args:
+            conn: Connexion sur la sortie, avec la base temporaire attachée
+            table_name: Table copiée
+            srid_map: Correspondance {ancien srid: nouveau srid}
+            
+        Returns:
+            Expression de sélection ('*' si aucune géométrie n'est concernée)
+        """
+        if not srid_map:
+            return "*"
+        remapped = {
+            column.casefold(): srid_map[srid] for column, srid in conn.execute(
+                "SELECT f_geometry_column, srid FROM shard.geometry_columns "
+                "WHERE f_table_name = ? COLLATE NOCASE", (table_name,)
+            ) if srid in srid_map
+        }
+        if not remapped:
+            return "*"
+        
+        columns = []
+        for row in conn.execute(f"PRAGMA shard.table_info({_quote_identifier(table_name)})"):
+            quoted = _quote_identifier(row[1])
+            new_srid = remapped.get(row[1].casefold())
+            columns.append(quoted if new_srid is None else f"_set_spatialite_blob_srid({quoted}, {int(new_srid)})")
+        return ", ".join(columns)
+    
+    def _merge_shard_metadata(self, conn: sqlite3.Connection, main_tables: set,
+                              new_tables: List[str], srid_map: Optional[Dict[int, int]] = None):
+        """
+        Copie les lignes de métadonnées SpatiaLite des tables fusionnées.
+        
+        Args:
+            conn: Connexion sur la sortie, avec la base temporaire attachée
+            main_tables: Noms (casefold) des tables déjà présentes dans la sortie
+            new_tables: Tables copiées depuis la base temporaire
+            srid_map: Systèmes de coordonnées renumérotés {ancien srid: nouveau srid}
+        """
+        if not new_tables:
+            return
+        
+        # Toutes les tables système indexées par f_table_name
+        # (geometry_columns, geometry_columns_statistics, ...)
+        for table in sorted(main_tables):
+            if table.startswith('sqlite_'):
+                continue
+            quoted = _quote_identifier(table)
+            columns = {row[1].casefold() for row in conn.execute(f"PRAGMA main.table_info({quoted})")}
+            if 'f_table_name' not in columns:
+                continue
+            shard_columns = conn.execute(f"PRAGMA shard.table_info({quoted})").fetchall()
+            if not shard_columns:
+                continue
+            for name in new_tables:
+                conn.execute(
+                    f"INSERT OR IGNORE INTO main.{quoted} SELECT * FROM shard.{quoted} "
+                    "WHERE f_table_name = ? COLLATE NOCASE", (name,)
+                )
+        
+        if not srid_map:
+            return
+        
+        # Ligne par ligne : une renumérotation ne doit pas en enchaîner une autre
+        for name in new_tables:
+            for column, srid in conn.execute(
+                "SELECT f_geometry_column, srid FROM main.geometry_columns "
+                "WHERE f_table_name = ? COLLATE NOCASE", (name,)
+            ).fetchall():
+                if srid in srid_map:
+                    conn.execute(
+                        "UPDATE main.geometry_columns SET srid = ? "
+                        "WHERE f_table_name = ? COLLATE NOCASE AND f_geometry_column = ? COLLATE NOCASE",
+                        (srid_map[srid], name, column)
+                    )
+    
+    def _copy_layer_arrow(self, source_layer, dest_ds, layer_name: str,
+                          feature_count: int) -> Tuple[Optional[object], int]:
+        """
+        Copie une couche par lots Arrow (GetArrowStream / WritePyArrow).
+        
+        Args:
+            source_layer: Couche OGR source
+            dest_ds: Datasource SQLite de destination
+            layer_name: Nom de la couche à créer
+            feature_count: Nombre d'entités attendu (barre de progression)
+            
+        Returns:
+            Tuple (couche créée ou None, nombre d'entités copiées)
+        """
+        dest_layer = dest_ds.CreateLayer(
+            layer_name,
+            self._get_layer_srs(layer_name, source_layer),
+            source_layer.GetGeomType(),
+            ['SPATIAL_INDEX=NO', 'FORMAT=SPATIALITE']  # Index créé après chargement
+        )
+        if dest_layer is None:
+            return (None, 0)
+        
+        # Copier la définition des champs ; le driver SQLite peut renommer les
+        # champs (minuscules, caractères spéciaux) : les colonnes Arrow suivent
+        source_layer_def = source_layer.GetLayerDefn()
+        dest_layer_def = dest_layer.GetLayerDefn()
+        field_count = source_layer_def.GetFieldCount()
+        self.logger.debug(f"  Champs à copier: {field_count}")
+        
+        for j in range(field_count):
+            dest_layer.CreateField(source_layer_def.GetFieldDefn(j))
+        renamed = {
+            source_layer_def.GetFieldDefn(j).GetName(): dest_layer_def.GetFieldDefn(j).GetName()
+            for j in range(field_count)
+        }
+        renamed = {src: dst for src, dst in renamed.items() if src != dst}
+        
+        write_options = [f"FID={source_layer.GetFIDColumn() or 'OGC_FID'}"]
+        if source_layer.GetGeomType() != ogr.wkbNone:
+            write_options.append(f"GEOMETRY_NAME={source_layer.GetGeometryColumn() or 'wkb_geometry'}")
+        
+        feature_bar = None
+        if tqdm and feature_count > _ARROW_BATCH_SIZE:
+            feature_bar = tqdm(total=feature_count, desc=f"  {layer_name}",
+                               unit="entité", leave=False)
+        
+        # Écrire dans des transactions explicites (validées toutes les
+        # _TRANSACTION_SIZE entités) plutôt qu'une transaction par entité
+        converted = 0
+        uncommitted = 0
+        dest_layer.StartTransaction()
+        try:
+            # Géométries en WKB : format attendu par le driver SQLite, sans conversion
+            stream = source_layer.GetArrowStreamAsPyArrow([
+                f'MAX_FEATURES_IN_BATCH={_ARROW_BATCH_SIZE}', 'GEOMETRY_ENCODING=WKB'
+            ])
+            schema = None
+            for batch in stream:
+                if renamed:
+                    if schema is None:
+                        schema = pa.schema(
+                            [field.with_name(renamed.get(field.name, field.name)) for field in batch.schema],
+                            metadata=batch.schema.metadata
+                        )
+                    batch = pa.RecordBatch.from_arrays(batch.columns, schema=schema)
+                dest_layer.WritePyArrow(batch, options=write_options)
+                converted += batch.num_rows
+                uncommitted += batch.num_rows
+                if uncommitted >= _TRANSACTION_SIZE:
+                    dest_layer.CommitTransaction()
+                    dest_layer.StartTransaction()
+                    uncommitted = 0
+                if feature_bar:
+                    feature_bar.update(batch.num_rows)
+            dest_layer.CommitTransaction()
+        except RuntimeError:
+            dest_layer.RollbackTransaction()
+            raise
+        finally:
+            stream = None
+            if feature_bar:
+                feature_bar.close()
+        
+        return (dest_layer, converted)
+    
     def _convert_with_python_api(self, layers: list, overwrite: bool,
                                 preserve_metadata: bool = True,
                                 preserve_aliases: bool = True,
@@ -2092,28 +4205,43 @@ class GDBToSpatialiteConverter:
             self.logger.error("Le driver SQLite n'est pas disponible.")
             return False
         
-        # Ouvrir la source GDB
-        source_ds = driver_gdb.Open(str(self.gdb_path), 0)
+        # Source GDB : datasource déjà ouverte pour la liste des couches et les
+        # métadonnées (fermée par convert() via l'extracteur)
+        source_ds = self.metadata_extractor.get_datasource()
         if source_ds is None:
             self.logger.error(f"Impossible d'ouvrir la géodatabase: {self.gdb_path}")
             return False
         
-        # Créer la destination Spatialite
-        if self.output_path.exists():
-            self.output_path.unlink()
+        # Créer la destination Spatialite (ou la rouvrir en cas de reprise :
+        # _prepare_conversion a déjà supprimé le fichier si overwrite est activé)
+        resuming = self.output_path.exists()
         
-        dest_ds = driver_sqlite.CreateDataSource(str(self.output_path))
+        # PRAGMA appliqués par le driver SQLite à l'ouverture (comme pour ogr2ogr)
+        previous_pragma = gdal.GetConfigOption('OGR_SQLITE_PRAGMA')
+        previous_cache = gdal.GetConfigOption('OGR_SQLITE_CACHE')
+        gdal.SetConfigOption('OGR_SQLITE_PRAGMA', self._sqlite_load_pragmas(fast_mode))
+        gdal.SetConfigOption('OGR_SQLITE_CACHE', str(self._sqlite_cache_mb(fast_mode)))
+        try:
+            if resuming:
+                self.metadata_applier.close()
+                dest_ds = driver_sqlite.Open(str(self.output_path), 1)
+            else:
+                dest_ds = driver_sqlite.CreateDataSource(str(self.output_path))
+        finally:
+            gdal.SetConfigOption('OGR_SQLITE_PRAGMA', previous_pragma)
+            gdal.SetConfigOption('OGR_SQLITE_CACHE', previous_cache)
         if dest_ds is None:
             self.logger.error(f"Impossible de créer le fichier Spatialite: {self.output_path}")
             source_ds = None
             return False
         
         # Initialiser Spatialite
-        try:
-            dest_ds.ExecuteSQL("SELECT InitSpatialMetadata(1)")
-            self.logger.info("Spatialite initialisé")
-        except Exception as e:
-            self.logger.warning(f"Impossible d'initialiser Spatialite automatiquement: {e}")
+        if not resuming:
+            try:
+                dest_ds.ExecuteSQL("SELECT InitSpatialMetadata(1)")
+                self.logger.info("Spatialite initialisé")
+            except Exception as e:
+                self.logger.warning(f"Impossible d'initialiser Spatialite automatiquement: {e}")
         
         success_count = 0
         failed_layers = []
@@ -2133,13 +4261,26 @@ class GDBToSpatialiteConverter:
                 feature_count = source_layer.GetFeatureCount()
                 self.logger.debug(f"  Entités à convertir: {feature_count}")
                 
-                # Créer la couche de destination
-                dest_layer = dest_ds.CreateLayer(
-                    layer_name_item,
-                    source_layer.GetSpatialRef(),
-                    source_layer.GetGeomType(),
-                    ['SPATIAL_INDEX=YES', 'FORMAT=SPATIALITE']
-                )
+                # Copier la couche par lots Arrow (GDAL >= 3.8 et pyarrow), sinon
+                # avec CopyLayer (boucle sur les entités entièrement en C++)
+                try:
+                    if (pa is not None and hasattr(source_layer, 'GetArrowStreamAsPyArrow')
+                            and hasattr(ogr.Layer, 'WritePyArrow')):
+                        dest_layer, converted = self._copy_layer_arrow(
+                            source_layer, dest_ds, layer_name_item, feature_count
+                        )
+                    else:
+                        dest_layer = dest_ds.CopyLayer(
+                            source_layer, layer_name_item,
+                            ['SPATIAL_INDEX=NO', 'FORMAT=SPATIALITE']  # Index créé après chargement
+                        )
+                        converted = dest_layer.GetFeatureCount() if dest_layer is not None else 0
+                except RuntimeError as e:
+                    self.logger.error(f"✗ Erreur lors de la copie de '{layer_name_item}': {e}")
+                    failed_layers.append((layer_name_item, str(e)))
+                    if progress_bar:
+                        progress_bar.update(1)
+                    continue
                 
                 if dest_layer is None:
                     self.logger.error(f"Échec de la création de la couche '{layer_name_item}'.")
@@ -2148,43 +4289,10 @@ class GDBToSpatialiteConverter:
                         progress_bar.update(1)
                     continue
                 
-                # Copier la définition des champs
-                source_layer_def = source_layer.GetLayerDefn()
-                field_count = source_layer_def.GetFieldCount()
-                self.logger.debug(f"  Champs à copier: {field_count}")
-                
-                for j in range(field_count):
-                    field_def = source_layer_def.GetFieldDefn(j)
-                    dest_layer.CreateField(field_def)
-                
-                # Copier les entités avec progression
-                source_layer.ResetReading()
-                feature_bar = None
-                if tqdm and feature_count > 100:
-                    feature_bar = tqdm(total=feature_count, desc=f"  {layer_name_item}", 
-                                      unit="entité", leave=False)
-                
-                converted = 0
-                for feature in source_layer:
-                    dest_layer.CreateFeature(feature)
-                    converted += 1
-                    if feature_bar and converted % 100 == 0:
-                        feature_bar.update(100)
-                
-                if feature_bar:
-                    feature_bar.update(feature_count - converted)
-                    feature_bar.close()
-                
                 dest_layer.SyncToDisk()
                 self.logger.info(f"✓ Couche '{layer_name_item}' convertie: {converted} entités")
                 success_count += 1
-                
-                # Appliquer les métadonnées après conversion réussie
-                if preserve_metadata:
-                    self._post_process_metadata(
-                        layer_name_item, preserve_aliases, preserve_domains,
-                        preserve_primary_keys, preserve_triggers
-                    )
+                self._converted_layers.append(layer_name_item)
                 
                 if progress_bar:
                     progress_bar.update(1)
@@ -2193,10 +4301,17 @@ class GDBToSpatialiteConverter:
         source_ds = None
         dest_ds = None
         
+        # Appliquer les métadonnées une fois la sortie fermée par GDAL
+        if preserve_metadata:
+            self._post_process_all_metadata(
+                self._post_pass_layers(), preserve_aliases, preserve_domains,
+                preserve_primary_keys, preserve_triggers
+            )
+        
         self._display_conversion_summary(success_count, len(layers), failed_layers, self.output_path)
         
-        # Optimiser la base SQLite après conversion
-        if success_count > 0:
+        # Optimiser en dernier : ANALYZE couvre aussi les index et tables de métadonnées
+        if success_count > 0 or self._resumed_layers:
             self._optimize_spatialite_database(fast_mode)
         
         return success_count > 0
@@ -2225,6 +4340,9 @@ Exemples:
   # Écraser le fichier de sortie s'il existe
   python gdb_to_spatialite.py Role_2024.gdb output.sqlite --overwrite
   
+  # Exporter en GeoParquet (un fichier par couche dans le dossier)
+  python gdb_to_spatialite.py Role_2024.gdb output_parquet --output-format parquet
+  
   # Lister les couches disponibles
   python gdb_to_spatialite.py Role_2024.gdb output.sqlite --list-layers
         """
@@ -2255,6 +4373,13 @@ Exemples:
         help="Écraser le fichier de sortie s'il existe déjà"
     )
     
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Compléter un fichier de sortie existant en ne convertissant que les couches "
+             "absentes ou incomplètes"
+    )
+    
     parser.add_argument(
         "--list-layers",
         action="store_true",
@@ -2265,7 +4390,7 @@ Exemples:
         "--workers",
         type=int,
         default=1,
-        help="Nombre de threads pour la conversion parallèle (défaut: 1, séquentiel)"
+        help="Nombre de processus pour la conversion parallèle (défaut: 1, séquentiel)"
     )
     
     parser.add_argument(
@@ -2310,6 +4435,22 @@ Exemples:
         help="Ne pas recréer les triggers"
     )
     
+    parser.add_argument(
+        "--output-format",
+        choices=_OUTPUT_FORMATS,
+        default="sqlite",
+        help="Format de sortie: sqlite (Spatialite, défaut) ou parquet "
+             "(dossier avec un fichier GeoParquet par couche, sans métadonnées ESRI)"
+    )
+    
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=None,
+        help="Cache SQLite pendant le chargement, en Mo par processus "
+             "(défaut: quart de la mémoire disponible, limité à la taille de la GDB)"
+    )
+    
     parser.add_argument(
         "--fast-mode",
         action="store_true",
@@ -2317,6 +4458,8 @@ Exemples:
     )
     
     args = parser.parse_args()
+    if args.cache_mb is not None and args.cache_mb <= 0:
+        parser.error("--cache-mb doit être un entier positif")
     
     try:
         logger = ProgressLogger(verbose=not args.quiet)
@@ -2327,7 +4470,9 @@ Exemples:
             layers = converter.get_layers()
             for i, layer in enumerate(layers, 1):
                 info = converter._get_layer_info(layer)
-                feature_count = info.get('feature_count', '?') if info else '?'
+                feature_count = info.get('feature_count', -1) if info else -1
+                if feature_count < 0:
+                    feature_count = '?'
                 print(f"  {i}. {layer} ({feature_count} entités)")
             return 0
         
@@ -2341,7 +4486,10 @@ Exemples:
             preserve_domains=not args.skip_domains,
             preserve_primary_keys=not args.skip_primary_keys,
             preserve_triggers=not args.skip_triggers,
-            fast_mode=args.fast_mode
+            fast_mode=args.fast_mode,
+            resume=args.resume,
+            cache_mb=args.cache_mb,
+            output_format=args.output_format
         )
         return 0 if success else 1
     
@@ -2352,9 +4500,9 @@ Exemples:
         print(f"ERREUR: {e}")
         return 1
     except Exception as e:
-        print(f"ERREUR inattendue: {e}")
-        import traceback
-        traceback.print_exc()
+        # Un seul enregistrement, pile d'appels incluse (gestionnaire de secours
+        # sur stderr si le logger n'a pas encore été configuré)
+        logging.getLogger('GDB2SQL').exception(f"ERREUR inattendue: {e}")
         return 1
 
 